@@ -9,7 +9,7 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import List, Dict
+from typing import List
 
 from dotenv import load_dotenv
 
@@ -18,10 +18,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from stock_friend.gateways.compliance.zoya_gateway import ZoyaComplianceGateway
 from stock_friend.infrastructure.rate_limiter import RateLimiter
+from stock_friend.models.compliance import ComplianceReport
 
 
 def save_reports_to_file(
-    reports: List[Dict],
+    reports: List[ComplianceReport],
     output_path: Path,
     asset_type: str,
 ) -> None:
@@ -29,21 +30,21 @@ def save_reports_to_file(
     Save compliance reports to JSON file.
 
     Args:
-        reports: List of report dictionaries
+        reports: List of compliance reports
         output_path: Path to save JSON file
         asset_type: "stock" or "fund"
     """
     output_data = {
         "asset_type": asset_type,
         "total_count": len(reports),
-        "reports": reports,
+        "reports": [report.to_dict() for report in reports],
     }
 
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(output_data, f, indent=2)
 
 
-def print_summary(reports: List[Dict], asset_type: str) -> None:
+def print_summary(reports: List[ComplianceReport], asset_type: str) -> None:
     """Print summary statistics about fetched reports."""
     print(f"\n{'=' * 80}")
     print(f"Summary: Compliant {asset_type.capitalize()}s")
@@ -57,7 +58,7 @@ def print_summary(reports: List[Dict], asset_type: str) -> None:
     # Group by exchange
     by_exchange = {}
     for report in reports:
-        exchange = report.get("exchange", "Unknown")
+        exchange = report.exchange or "Unknown"
         by_exchange.setdefault(exchange, []).append(report)
 
     print(f"\nBy Exchange:")
@@ -67,9 +68,9 @@ def print_summary(reports: List[Dict], asset_type: str) -> None:
     # Show first 10 examples
     print(f"\nFirst 10 examples:")
     for report in reports[:10]:
-        symbol = report.get("symbol", "N/A")
-        name = report.get("name", "N/A")
-        exchange = report.get("exchange", "N/A")
+        symbol = report.symbol or "N/A"
+        name = report.name or "N/A"
+        exchange = report.exchange or "N/A"
         print(f"  {symbol:8s} ({exchange:4s}): {name}")
 
     if len(reports) > 10:
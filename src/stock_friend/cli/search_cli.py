@@ -4,6 +4,7 @@ Search command for stock-friend CLI.
 Provides stock search functionality by ticker symbol or company name.
 """
 
+import atexit
 import logging
 import sys
 from typing import Optional
@@ -69,6 +70,10 @@ def _get_search_service() -> SearchService:
             compliance_factory = ComplianceGatewayFactory(config, cache_manager, rate_limiter)
             compliance_gateway = compliance_factory.create_gateway()
 
+            # The service lives for the whole process, so release the factory's
+            # shared compliance thread pool at interpreter exit
+            atexit.register(compliance_factory.shutdown)
+
             # Create service with both gateways
             _search_service = SearchService(
                 gateway=gateway,
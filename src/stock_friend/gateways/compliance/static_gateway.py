@@ -234,7 +234,7 @@ class StaticComplianceGateway(IComplianceGateway):
                         checked_at = datetime.now()
                         if last_updated_str:
                             try:
-                                checked_at = datetime.strptime(last_updated_str, '%Y-%m-%d')
+                                checked_at = datetime.fromisoformat(last_updated_str)
                             except ValueError:
                                 logger.warning(
                                     f"Invalid date format for {ticker} at row {row_num}: {last_updated_str}"
@@ -5,13 +5,17 @@ Integrates with Zoya Finance GraphQL API for halal stock screening.
 """
 
 import logging
+import random
+import string
 import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from decimal import Decimal
 from functools import wraps
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from stock_friend.gateways.compliance.base import (
     ComplianceException,
@@ -19,7 +23,7 @@ from stock_friend.gateways.compliance.base import (
 )
 from stock_friend.infrastructure.cache_manager import CacheManager
 from stock_friend.infrastructure.rate_limiter import RateLimiter
-from stock_friend.models.compliance import ComplianceStatus
+from stock_friend.models.compliance import ComplianceReport, ComplianceStatus
 
 logger = logging.getLogger(__name__)
 
@@ -73,7 +77,7 @@ class ZoyaComplianceGateway(IComplianceGateway):
     - GraphQL API with sandbox and live environments
     - Rate limit: 10 requests per second (configurable)
     - Aggressive caching (30 days TTL - compliance rarely changes)
-    - Batch operations using GraphQL queries
+    - Batch operations with bounded concurrent lookups
     - Automatic retries with exponential backoff
     - Data accuracy: Returns unknown status when data unavailable
 
@@ -97,6 +101,68 @@ class ZoyaComplianceGateway(IComplianceGateway):
         True
     """
 
+    # Attempts per request when the API answers 429 Too Many Requests
+    MAX_THROTTLE_ATTEMPTS = 3
+
+    # Cap on a server-sent Retry-After so one 429 can't stall a worker indefinitely
+    MAX_RETRY_AFTER_SECONDS = 60.0
+
+    # Stock reports query; only the inline input clause varies per page
+    REPORTS_QUERY_TEMPLATE = string.Template(
+        """
+            query GetStockReports {
+              basicCompliance {
+                reports${input_clause} {
+                  nextToken
+                  items {
+                    symbol
+                    name
+                    exchange
+                    status
+                    reportDate
+                    purificationRatio
+                  }
+                }
+              }
+            }
+            """
+    )
+
+    # Fund reports query (funds field accepts no pagination arguments)
+    FUNDS_QUERY = """
+            query GetFundReports {
+              basicCompliance {
+                funds {
+                  nextToken
+                  items {
+                    symbol
+                    name
+                    exchange
+                    status
+                    reportDate
+                    holdingsAsOfDate
+                  }
+                }
+              }
+            }
+            """
+
+    # GraphQL query for basic compliance report (only the symbol variable changes)
+    BASIC_REPORT_QUERY = """
+            query BasicReport($symbol: String!) {
+              basicCompliance {
+                report(symbol: $symbol) {
+                  symbol
+                  name
+                  exchange
+                  status
+                  reportDate
+                  purificationRatio
+                }
+              }
+            }
+            """
+
     def __init__(
         self,
         api_key: str,
@@ -104,6 +170,8 @@ class ZoyaComplianceGateway(IComplianceGateway):
         cache_manager: Optional[CacheManager] = None,
         rate_limiter: Optional[RateLimiter] = None,
         cache_ttl_days: int = 30,
+        max_workers: int = 4,
+        executor: Optional[Executor] = None,
     ):
         """
         Initialize Zoya compliance gateway.
@@ -114,6 +182,9 @@ class ZoyaComplianceGateway(IComplianceGateway):
             cache_manager: Optional cache manager (recommended)
             rate_limiter: Optional rate limiter (recommended)
             cache_ttl_days: Cache TTL in days (default: 30)
+            max_workers: Maximum concurrent lookups in check_batch (default: 4)
+            executor: Optional shared executor for check_batch lookups. When
+                provided, its pool size bounds concurrency instead of max_workers.
 
         Note:
             The environment (sandbox/live) is inferred from the API key prefix.
@@ -123,6 +194,8 @@ class ZoyaComplianceGateway(IComplianceGateway):
         self.cache_manager = cache_manager
         self.rate_limiter = rate_limiter
         self.cache_ttl_days = cache_ttl_days
+        self.max_workers = max_workers
+        self.executor = executor
 
         # Infer environment from API key prefix
         if api_key.startswith("sandbox-"):
@@ -141,6 +214,19 @@ class ZoyaComplianceGateway(IComplianceGateway):
         if self.rate_limiter:
             self.rate_limiter.configure("zoya", requests_per_hour=36000)
 
+        # Reuse pooled connections across requests (one TLS handshake per host,
+        # not per page). Retries are handled by retry_on_failure, not urllib3.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=0)
+        )
+        self._session.headers.update(
+            {
+                "Authorization": self.api_key,  # Format: "sandbox-KEY" or "live-KEY"
+                "Content-Type": "application/json",
+            }
+        )
+
         logger.info(
             f"Initialized ZoyaComplianceGateway (environment={self.environment}, api_url={api_url})"
         )
@@ -189,33 +275,13 @@ class ZoyaComplianceGateway(IComplianceGateway):
                 logger.debug(f"Cache hit for {ticker} compliance")
                 return cached_status
 
-        # Apply rate limiting
-        if self.rate_limiter:
-            self.rate_limiter.acquire("zoya")
-
         try:
             logger.info(f"Checking compliance for {ticker} via Zoya API")
 
-            # GraphQL query for basic compliance report
-            query = """
-            query BasicReport($symbol: String!) {
-              basicCompliance {
-                report(symbol: $symbol) {
-                  symbol
-                  name
-                  exchange
-                  status
-                  reportDate
-                  purificationRatio
-                }
-              }
-            }
-            """
-
             variables = {"symbol": ticker}
 
             # Execute GraphQL request
-            response = self._execute_graphql(query, variables)
+            response = self._execute_graphql(self.BASIC_REPORT_QUERY, variables)
 
             # Parse response
             report = response.get("data", {}).get("basicCompliance", {}).get("report")
@@ -280,13 +346,14 @@ class ZoyaComplianceGateway(IComplianceGateway):
         """
         Check compliance for multiple stocks (batch operation).
 
-        Uses individual stock lookups (no true batch API in basicCompliance).
+        Uses individual stock lookups (no true batch API in basicCompliance),
+        issued concurrently with at most max_workers requests in flight.
 
         Args:
             tickers: List of ticker symbols
 
         Returns:
-            Dictionary mapping tickers to ComplianceStatus objects
+            Dictionary mapping tickers to ComplianceStatus objects (input order preserved)
 
         Note:
             Tickers not found in Zoya return unknown status.
@@ -295,28 +362,37 @@ class ZoyaComplianceGateway(IComplianceGateway):
             return {}
 
         tickers = [ticker.upper().strip() for ticker in tickers]
-        results = {}
 
         logger.info(f"Checking compliance for {len(tickers)} tickers via Zoya API")
 
-        # Check each ticker individually
-        for ticker in tickers:
-            try:
-                status = self.check_compliance(ticker)
-                results[ticker] = status
-            except Exception as e:
-                logger.error(f"Error checking {ticker}: {e}")
-                # Return unknown status on error
-                results[ticker] = ComplianceStatus(
-                    ticker=ticker,
-                    is_compliant=None,
-                    reasons=[f"API error: {str(e)}"],
-                    source="zoya",
-                )
+        # Lookups are independent, so overlap their network round-trips.
+        # executor.map yields in submission order, keeping results deterministic.
+        if self.executor is not None:
+            statuses = list(self.executor.map(self._check_batch_item, tickers))
+        else:
+            workers = max(1, min(self.max_workers, len(tickers)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                statuses = list(executor.map(self._check_batch_item, tickers))
+
+        results = dict(zip(tickers, statuses))
 
         logger.info(f"Batch compliance check completed: {len(results)}/{len(tickers)} successful")
         return results
 
+    def _check_batch_item(self, ticker: str) -> ComplianceStatus:
+        """Check a single batch ticker, returning unknown status on error."""
+        try:
+            return self.check_compliance(ticker)
+        except Exception as e:
+            logger.error(f"Error checking {ticker}: {e}")
+            # Return unknown status on error
+            return ComplianceStatus(
+                ticker=ticker,
+                is_compliant=None,
+                reasons=[f"API error: {str(e)}"],
+                source="zoya",
+            )
+
     def filter_compliant(self, tickers: List[str]) -> List[str]:
         """
         Filter to only halal-compliant stocks.
@@ -348,7 +424,8 @@ class ZoyaComplianceGateway(IComplianceGateway):
         status_filter: Optional[str] = None,
         asset_type: str = "stock",
         max_items: Optional[int] = None,
-    ) -> List[Dict]:
+        use_cache: bool = False,
+    ) -> List[ComplianceReport]:
         """
         Fetch all compliance reports from Zoya API with pagination.
 
@@ -359,9 +436,11 @@ class ZoyaComplianceGateway(IComplianceGateway):
             status_filter: Optional status filter (e.g., "COMPLIANT", "NOT_COMPLIANT", "QUESTIONABLE")
             asset_type: Asset type to query - "stock" or "fund" (default: "stock")
             max_items: Optional limit on total items to fetch (None = fetch all)
+            use_cache: Serve and store pages through the cache manager (default: False,
+                always fetch live)
 
         Returns:
-            List of report dictionaries containing symbol, name, exchange, status, etc.
+            List of ComplianceReport objects (symbol, name, exchange, status, etc.)
 
         Example:
             >>> gateway = ZoyaComplianceGateway(api_key="...", environment="sandbox")
@@ -370,58 +449,33 @@ class ZoyaComplianceGateway(IComplianceGateway):
 
         Note:
             - Respects rate limits (10 requests/second configured in __init__)
-            - Results are NOT cached due to large dataset size
+            - With use_cache=True and a cache manager, pages are cached for cache_ttl_days
+              keyed by the pagination token that requested them
             - Each page returns up to ~1000 items (Zoya's default)
             - For production use, consider saving results to file/database
         """
         if asset_type not in ("stock", "fund"):
             raise ValueError(f"Invalid asset_type: {asset_type}. Must be 'stock' or 'fund'")
 
-        all_items = []
-        next_token = None
-        page_count = 0
-
         logger.info(
             f"Fetching all {asset_type} reports from Zoya "
             f"(status_filter={status_filter}, max_items={max_items})"
         )
 
         try:
-            while True:
-                page_count += 1
-
-                # Fetch page
-                page_data = self._fetch_reports_page(
-                    asset_type=asset_type,
-                    status_filter=status_filter,
-                    next_token=next_token,
-                )
-
-                # Extract items
-                items = page_data.get("items", [])
-                all_items.extend(items)
-
-                logger.info(
-                    f"Fetched page {page_count}: {len(items)} items "
-                    f"(total so far: {len(all_items)})"
-                )
-
-                # Check if we've reached max_items
-                if max_items and len(all_items) >= max_items:
-                    all_items = all_items[:max_items]
-                    logger.info(f"Reached max_items limit ({max_items}). Stopping pagination.")
-                    break
-
-                # Check for next page
-                next_token = page_data.get("nextToken")
-                if not next_token:
-                    logger.info("No more pages. Pagination complete.")
-                    break
-
-            logger.info(
-                f"Completed fetching {asset_type} reports: "
-                f"{len(all_items)} items across {page_count} pages"
-            )
+            # Pages are fetched lazily, so breaking out stops pagination as soon
+            # as max_items is reached. Items are added one extend() per page.
+            all_items: List[ComplianceReport] = []
+            for items in self._iter_report_pages(asset_type, status_filter, use_cache):
+                if max_items:
+                    all_items.extend(items[: max_items - len(all_items)])
+                    if len(all_items) >= max_items:
+                        logger.info(f"Reached max_items limit ({max_items}). Stopping pagination.")
+                        break
+                else:
+                    all_items.extend(items)
+
+            logger.info(f"Completed fetching {asset_type} reports: {len(all_items)} items")
 
             return all_items
 
@@ -429,6 +483,92 @@ class ZoyaComplianceGateway(IComplianceGateway):
             logger.error(f"Failed to fetch all reports: {e}")
             raise ComplianceException(f"Failed to fetch all reports: {e}")
 
+    def _iter_report_pages(
+        self,
+        asset_type: str,
+        status_filter: Optional[str] = None,
+        use_cache: bool = False,
+    ) -> Iterator[List[ComplianceReport]]:
+        """
+        Lazily yield report pages, fetching the next page only when needed.
+
+        Args:
+            asset_type: "stock" or "fund"
+            status_filter: Optional status filter
+            use_cache: Serve and store pages through the cache manager
+
+        Yields:
+            List of reports for each page, in page order
+        """
+        next_token = None
+        page_count = 0
+
+        while True:
+            page_count += 1
+            page_data = self._get_reports_page(
+                asset_type=asset_type,
+                status_filter=status_filter,
+                next_token=next_token,
+                use_cache=use_cache,
+            )
+
+            items = page_data.get("items", [])
+            logger.info(f"Fetched page {page_count}: {len(items)} items")
+            yield items
+
+            # Check for next page
+            next_token = page_data.get("nextToken")
+            if not next_token:
+                logger.info("No more pages. Pagination complete.")
+                return
+
+    def _get_reports_page(
+        self,
+        asset_type: str,
+        status_filter: Optional[str],
+        next_token: Optional[str],
+        use_cache: bool = False,
+    ) -> Dict:
+        """
+        Get a page of reports, serving it from cache when enabled and available.
+
+        Pages are keyed by the token that requested them, not by position, so
+        a cached page always continues the chain its predecessor's nextToken
+        points to. Evicting or expiring one page only refetches that page.
+
+        Args:
+            asset_type: "stock" or "fund"
+            status_filter: Optional status filter
+            next_token: Pagination token for this page (None for the first page)
+            use_cache: Serve and store the page through the cache manager
+
+        Returns:
+            Dictionary with "items" and "nextToken" keys
+        """
+        use_cache = use_cache and self.cache_manager is not None
+        cache_key = (
+            f"compliance:zoya:{self.environment}:reports:"
+            f"{asset_type}:{status_filter}:{next_token or 'first'}"
+        )
+
+        if use_cache:
+            cached_page = self.cache_manager.get(cache_key)
+            if cached_page is not None:
+                logger.debug(f"Cache hit for {asset_type} reports page {next_token or 'first'}")
+                return cached_page
+
+        page_data = self._fetch_reports_page(
+            asset_type=asset_type,
+            status_filter=status_filter,
+            next_token=next_token,
+        )
+
+        if use_cache:
+            ttl = timedelta(days=self.cache_ttl_days)
+            self.cache_manager.set(cache_key, page_data, ttl=ttl)
+
+        return page_data
+
     def _fetch_reports_page(
         self,
         asset_type: str,
@@ -444,73 +584,33 @@ class ZoyaComplianceGateway(IComplianceGateway):
             next_token: Pagination token for next page
 
         Returns:
-            Dictionary with "items" and "nextToken" keys
+            Dictionary with "items" (ComplianceReport list) and "nextToken" keys
 
         Raises:
             ComplianceException: If request fails
         """
-        # Apply rate limiting
-        if self.rate_limiter:
-            self.rate_limiter.acquire("zoya")
-
         # Build GraphQL query based on asset type
         if asset_type == "stock":
             # For stocks, use reports field with input filters (inline)
             # Build the input object inline since ReportInput type doesn't exist as variable
             input_parts = []
             if status_filter:
-                input_parts.append(f'filters: {{ status: {status_filter} }}')
+                input_parts.append(f"filters: {{ status: {status_filter} }}")
             if next_token:
                 input_parts.append(f'nextToken: "{next_token}"')
 
-            input_str = ", ".join(input_parts) if input_parts else ""
+            input_str = ", ".join(input_parts)
             input_clause = f"(input: {{ {input_str} }})" if input_str else ""
 
-            query = f"""
-            query GetStockReports {{
-              basicCompliance {{
-                reports{input_clause} {{
-                  nextToken
-                  items {{
-                    symbol
-                    name
-                    exchange
-                    status
-                    reportDate
-                    purificationRatio
-                  }}
-                }}
-              }}
-            }}
-            """
-
-            variables = {}
+            query = self.REPORTS_QUERY_TEMPLATE.substitute(input_clause=input_clause)
             field_name = "reports"
 
         else:  # fund
-            # For funds, use funds field directly (no pagination support in query args)
-            query = """
-            query GetFundReports {
-              basicCompliance {
-                funds {
-                  nextToken
-                  items {
-                    symbol
-                    name
-                    exchange
-                    status
-                    reportDate
-                    holdingsAsOfDate
-                  }
-                }
-              }
-            }
-            """
-
-            # Funds query doesn't accept nextToken as argument
-            variables = {}
+            query = self.FUNDS_QUERY
             field_name = "funds"
 
+        variables = {}
+
         # Execute GraphQL request
         response = self._execute_graphql(query, variables)
 
@@ -521,7 +621,10 @@ class ZoyaComplianceGateway(IComplianceGateway):
             logger.warning(f"No data returned for {asset_type} reports")
             return {"items": [], "nextToken": None}
 
-        return data
+        return {
+            "items": [ComplianceReport.from_zoya(item) for item in data.get("items") or []],
+            "nextToken": data.get("nextToken"),
+        }
 
     def _parse_zoya_status(self, status_str: str) -> Optional[bool]:
         """
@@ -557,22 +660,36 @@ class ZoyaComplianceGateway(IComplianceGateway):
         Raises:
             ComplianceException: If request fails
         """
-        headers = {
-            "Authorization": self.api_key,  # Format: "sandbox-KEY" or "live-KEY"
-            "Content-Type": "application/json",
-        }
-
         payload = {
             "query": query,
             "variables": variables,
         }
 
-        response = requests.post(
-            self.api_url,
-            json=payload,
-            headers=headers,
-            timeout=30,
-        )
+        for attempt in range(1, self.MAX_THROTTLE_ATTEMPTS + 1):
+            # Every attempt, including 429 retries, spends a token
+            if self.rate_limiter:
+                self.rate_limiter.acquire("zoya")
+
+            # Authorization and Content-Type headers are set once on the session
+            response = self._session.post(
+                self.api_url,
+                json=payload,
+                timeout=30,
+            )
+
+            # Let the server's reported budget drive local throttling
+            if self.rate_limiter:
+                self.rate_limiter.record_headers("zoya", response.headers)
+
+            if response.status_code != 429 or attempt == self.MAX_THROTTLE_ATTEMPTS:
+                break
+
+            delay = self._retry_after_seconds(response.headers, attempt)
+            logger.warning(
+                f"Zoya API throttled request (attempt {attempt}/{self.MAX_THROTTLE_ATTEMPTS}). "
+                f"Retrying in {delay:.1f}s..."
+            )
+            time.sleep(delay)
 
         if response.status_code != 200:
             raise ComplianceException(
@@ -588,6 +705,28 @@ class ZoyaComplianceGateway(IComplianceGateway):
 
         return data
 
+    @classmethod
+    def _retry_after_seconds(cls, headers, attempt: int) -> float:
+        """
+        Compute delay before retrying a throttled (429) request.
+
+        Args:
+            headers: Response headers
+            attempt: 1-based attempt number that was throttled
+
+        Returns:
+            Retry-After seconds when provided (capped at MAX_RETRY_AFTER_SECONDS),
+            else exponential backoff with jitter
+        """
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(cls.MAX_RETRY_AFTER_SECONDS, max(0.0, float(retry_after)))
+            except (TypeError, ValueError):
+                pass
+
+        return 2.0**attempt + random.uniform(0, 1)
+
     def get_name(self) -> str:
         """
         Return gateway identifier.
@@ -596,3 +735,7 @@ class ZoyaComplianceGateway(IComplianceGateway):
             Gateway name (e.g., "zoya_sandbox", "zoya_live")
         """
         return f"zoya_{self.environment}"
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self._session.close()
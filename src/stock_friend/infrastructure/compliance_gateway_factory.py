@@ -6,7 +6,9 @@ proper dependency injection.
 """
 
 import logging
-from typing import Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import ClassVar, Dict, FrozenSet, Optional, TYPE_CHECKING
 
 from stock_friend.gateways.compliance.base import IComplianceGateway
 from stock_friend.infrastructure.cache_manager import CacheManager
@@ -43,13 +45,24 @@ class ComplianceGatewayFactory:
         >>> gateway = factory.create_gateway("zoya")  # Override provider
     """
 
-    SUPPORTED_GATEWAYS = {"static", "zoya"}
+    # Provider -> builder method name, resolved on the instance at dispatch time
+    _BUILDERS: ClassVar[Dict[str, str]] = {
+        "static": "_create_static_gateway",
+        "zoya": "_create_zoya_gateway",
+    }
+
+    # Derived from the dispatch table so the two can't drift
+    SUPPORTED_GATEWAYS: ClassVar[FrozenSet[str]] = frozenset(_BUILDERS)
+
+    # Worker threads in the executor shared by all gateways from this factory
+    EXECUTOR_MAX_WORKERS: ClassVar[int] = 8
 
     def __init__(
         self,
         config: ApplicationConfig,
         cache_manager: Optional[CacheManager] = None,
         rate_limiter: Optional[RateLimiter] = None,
+        cache_gateways: bool = False,
     ):
         """
         Initialize compliance gateway factory.
@@ -58,15 +71,38 @@ class ComplianceGatewayFactory:
             config: Application configuration
             cache_manager: Optional cache manager for gateway caching
             rate_limiter: Optional rate limiter for API throttling
+            cache_gateways: Reuse one gateway instance per provider instead of
+                building a fresh one on every create_gateway call (default: False)
         """
         self.config = config
         self.cache_manager = cache_manager
         self.rate_limiter = rate_limiter
+        self.cache_gateways = cache_gateways
+        self._gateways: Dict[str, IComplianceGateway] = {}
 
         logger.info(
             f"Initialized ComplianceGatewayFactory (default provider: {self.config.compliance.provider})"
         )
 
+    @cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        """
+        Thread pool shared by every gateway this factory creates.
+
+        Created lazily on first use so factories that never build a
+        concurrent gateway don't spawn threads.
+        """
+        return ThreadPoolExecutor(
+            max_workers=self.EXECUTOR_MAX_WORKERS,
+            thread_name_prefix="compliance",
+        )
+
+    def shutdown(self) -> None:
+        """Shut down the shared executor, if it was ever created."""
+        executor = self.__dict__.pop("_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=True)
+
     def create_gateway(self, provider: Optional[str] = None) -> IComplianceGateway:
         """
         Create compliance gateway instance.
@@ -76,34 +112,37 @@ class ComplianceGatewayFactory:
                      If None, uses config.compliance.provider.
 
         Returns:
-            Configured IComplianceGateway instance
+            Configured IComplianceGateway instance (the cached instance for
+            this provider when cache_gateways is enabled)
 
         Raises:
             ValueError: If provider is invalid or configuration is missing
         """
-        # Use config provider if not explicitly specified
-        if provider is None:
-            provider = self.config.compliance.provider
-
-        provider = provider.lower()
+        # Use config provider if not explicitly specified; normalize once
+        prov = (self.config.compliance.provider if provider is None else provider).lower()
 
         # Validate provider
-        if provider not in self.SUPPORTED_GATEWAYS:
+        if prov not in self.SUPPORTED_GATEWAYS:
             raise ValueError(
-                f"Unsupported compliance provider: {provider}. "
-                f"Must be one of: {', '.join(self.SUPPORTED_GATEWAYS)}"
+                f"Unsupported compliance provider: {prov}. "
+                f"Must be one of: {', '.join(sorted(self.SUPPORTED_GATEWAYS))}"
             )
 
-        logger.info(f"Creating compliance gateway: {provider}")
+        if self.cache_gateways:
+            gateway = self._gateways.get(prov)
+            if gateway is not None:
+                return gateway
+
+        logger.info(f"Creating compliance gateway: {prov}")
 
-        # Create appropriate gateway
-        if provider == "static":
-            return self._create_static_gateway()
-        elif provider == "zoya":
-            return self._create_zoya_gateway()
-        else:
-            # Should never reach here due to validation above
-            raise ValueError(f"Unsupported provider: {provider}")
+        # Single dict dispatch to the provider's builder; resolved on self so
+        # subclass overrides of the _create_* methods are honoured
+        gateway = getattr(self, self._BUILDERS[prov])()
+
+        if self.cache_gateways:
+            self._gateways[prov] = gateway
+
+        return gateway
 
     def _create_static_gateway(self) -> "StaticComplianceGateway":
         """
@@ -166,6 +205,7 @@ class ComplianceGatewayFactory:
             cache_manager=self.cache_manager,
             rate_limiter=self.rate_limiter,
             cache_ttl_days=self.config.compliance_zoya.cache_ttl_days,
+            executor=self._executor,
         )
 
         # Mask API key for logging
@@ -7,7 +7,7 @@ Prevents exceeding API rate limits by using the token bucket algorithm.
 import logging
 import threading
 import time
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +31,7 @@ class TokenBucket:
         self.capacity = capacity
         self.refill_rate = refill_rate
         self.tokens = float(capacity)
-        self.last_refill_time = time.time()
+        self.last_refill_time = time.monotonic()
         self.lock = threading.Lock()
 
     def consume(self) -> bool:
@@ -50,9 +50,20 @@ class TokenBucket:
 
             return False
 
+    def clamp(self, remaining: float) -> None:
+        """
+        Lower available tokens to at most remaining (never raises them).
+
+        Args:
+            remaining: Upper bound on tokens, e.g. a server-reported budget
+        """
+        with self.lock:
+            self._refill()
+            self.tokens = max(0.0, min(self.tokens, remaining))
+
     def _refill(self) -> None:
         """Refill bucket based on elapsed time."""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_refill_time
 
         # Add tokens based on refill rate
@@ -94,17 +105,21 @@ class RateLimiter:
         self.buckets: Dict[str, TokenBucket] = {}
         self.lock = threading.Lock()
 
-    def configure(self, api_name: str, requests_per_hour: int) -> None:
+    def configure(
+        self, api_name: str, requests_per_hour: int, burst: Optional[int] = None
+    ) -> None:
         """
         Configure rate limit for an API.
 
         Args:
             api_name: API identifier (e.g., "yahoo_finance")
             requests_per_hour: Maximum requests per hour
+            burst: Bucket capacity, i.e. calls allowed back-to-back before pacing
+                kicks in (default: requests_per_hour, a full hour's budget)
         """
         with self.lock:
             self.buckets[api_name] = TokenBucket(
-                capacity=requests_per_hour,
+                capacity=burst if burst is not None else requests_per_hour,
                 refill_rate=requests_per_hour / 3600.0,  # Tokens per second
             )
 
@@ -124,20 +139,20 @@ class RateLimiter:
             RateLimitException: If timeout exceeded
             ValueError: If API not configured
         """
-        if api_name not in self.buckets:
+        bucket = self.buckets.get(api_name)
+        if bucket is None:
             raise ValueError(f"API not configured: {api_name}")
 
-        bucket = self.buckets[api_name]
-        start_time = time.time()
+        # Fast path: token available, no timeout bookkeeping needed
+        if bucket.consume():
+            return
 
-        while True:
-            if bucket.consume():
-                # Token acquired
-                return
+        start_time = time.monotonic()
 
+        while True:
             # No tokens available, wait
             if timeout is not None:
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 if elapsed >= timeout:
                     raise RateLimitException(
                         f"Rate limit timeout for {api_name} after {elapsed:.1f}s"
@@ -150,6 +165,10 @@ class RateLimiter:
             )
             time.sleep(wait_time)
 
+            if bucket.consume():
+                # Token acquired
+                return
+
     def try_acquire(self, api_name: str) -> bool:
         """
         Try to acquire token without blocking.
@@ -163,12 +182,41 @@ class RateLimiter:
         Raises:
             ValueError: If API not configured
         """
-        if api_name not in self.buckets:
+        bucket = self.buckets.get(api_name)
+        if bucket is None:
             raise ValueError(f"API not configured: {api_name}")
 
-        bucket = self.buckets[api_name]
         return bucket.consume()
 
+    def record_headers(self, api_name: str, headers: Mapping[str, str]) -> None:
+        """
+        Sync local budget with rate limit headers reported by the server.
+
+        Lowers the bucket to the server's remaining request count so acquire()
+        only starts waiting once the server signals pressure. Unknown APIs and
+        responses without a usable header are ignored.
+
+        Args:
+            api_name: API identifier
+            headers: Response headers (e.g., requests' case-insensitive dict)
+        """
+        bucket = self.buckets.get(api_name)
+        if bucket is None:
+            return
+
+        remaining = headers.get("x-ratelimit-remaining-requests") or headers.get(
+            "x-ratelimit-remaining"
+        )
+        if remaining is None:
+            return
+
+        try:
+            remaining_tokens = float(remaining)
+        except (TypeError, ValueError):
+            return
+
+        bucket.clamp(remaining_tokens)
+
     def get_available_tokens(self, api_name: str) -> int:
         """
         Get number of available tokens.
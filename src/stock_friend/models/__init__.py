@@ -16,6 +16,7 @@ from stock_friend.models.symbol import (
     SymbolConfidence,
     MarketRegion,
     ExchangeMapping,
+    ExchangeInfo,
 )
 
 __all__ = [
@@ -30,4 +31,5 @@ __all__ = [
     "SymbolConfidence",
     "MarketRegion",
     "ExchangeMapping",
+    "ExchangeInfo",
 ]
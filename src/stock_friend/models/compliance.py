@@ -7,7 +7,7 @@ Defines data structures for representing stock compliance status.
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 
 @dataclass
@@ -130,3 +130,73 @@ class ComplianceStatus:
         else:
             reason_str = ", ".join(self.reasons) if self.reasons else "Unknown reason"
             return f"✗ Non-Compliant: {reason_str}"
+
+
+@dataclass(frozen=True, slots=True)
+class ComplianceReport:
+    """
+    Single compliance report from a provider's bulk listing (e.g., Zoya reports/funds).
+
+    Slotted to keep per-item memory low when pulling thousands of reports.
+
+    Attributes:
+        symbol: Security ticker symbol
+        name: Security name
+        exchange: Listing exchange code
+        status: Provider status string (e.g., "COMPLIANT")
+        report_date: Report date as provided (ISO date string)
+        purification_ratio: Purification ratio (stocks only)
+        holdings_as_of_date: Holdings date (funds only)
+
+    Example:
+        >>> report = ComplianceReport.from_zoya({"symbol": "AAPL", "status": "COMPLIANT"})
+        >>> report.symbol
+        'AAPL'
+    """
+
+    symbol: str
+    name: Optional[str] = None
+    exchange: Optional[str] = None
+    status: Optional[str] = None
+    report_date: Optional[str] = None
+    purification_ratio: Optional[float] = None
+    holdings_as_of_date: Optional[str] = None
+
+    @classmethod
+    def from_zoya(cls, item: Dict[str, Any]) -> "ComplianceReport":
+        """
+        Build report from a Zoya GraphQL item.
+
+        Args:
+            item: Item dictionary with Zoya's camelCase field names
+
+        Returns:
+            ComplianceReport instance
+        """
+        return cls(
+            symbol=item["symbol"],
+            name=item.get("name"),
+            exchange=item.get("exchange"),
+            status=item.get("status"),
+            report_date=item.get("reportDate"),
+            purification_ratio=item.get("purificationRatio"),
+            holdings_as_of_date=item.get("holdingsAsOfDate"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a JSON-serializable dictionary using Zoya's field names.
+
+        Returns:
+            Dictionary with only the fields that are set
+        """
+        fields = {
+            "symbol": self.symbol,
+            "name": self.name,
+            "exchange": self.exchange,
+            "status": self.status,
+            "reportDate": self.report_date,
+            "purificationRatio": self.purification_ratio,
+            "holdingsAsOfDate": self.holdings_as_of_date,
+        }
+        return {key: value for key, value in fields.items() if value is not None}
@@ -8,6 +8,7 @@ different gateway formats with full audit trail.
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import List, Optional
 
 
@@ -79,6 +80,11 @@ class NormalizedSymbol:
         """Check if normalization is low confidence (may need review)."""
         return self.confidence == SymbolConfidence.LOW
 
+    @cached_property
+    def notes_text(self) -> str:
+        """Transformation notes joined once with "; " for display and substring checks."""
+        return "; ".join(self.transformation_notes)
+
     def summary(self) -> str:
         """
         Get human-readable summary of normalization.
@@ -86,7 +92,7 @@ class NormalizedSymbol:
         Returns:
             String summarizing the transformation
         """
-        notes_str = "; ".join(self.transformation_notes) if self.transformation_notes else "No transformation"
+        notes_str = self.notes_text or "No transformation"
         exchange_str = f" [{self.exchange_code}]" if self.exchange_code else ""
         return (
             f"{self.original_ticker} → {self.base_symbol}{exchange_str} "
@@ -116,3 +122,23 @@ class ExchangeMapping:
     def __str__(self) -> str:
         """String representation."""
         return f"{self.mic} ({self.exchange_name}) - {self.country_code}"
+
+
+@dataclass(frozen=True, slots=True)
+class ExchangeInfo:
+    """
+    yfinance suffix mapping used by SymbolNormalizationService.
+
+    Maps a yfinance ticker suffix (e.g., ".DE") to the Bloomberg-style
+    exchange code and market region used for compliance lookups.
+    """
+
+    yfinance_suffix: str  # yfinance ticker suffix (e.g., ".DE", ".L")
+    bloomberg_code: str  # Bloomberg-style exchange code (e.g., "XETR", "XLON")
+    exchange_name: str  # Human-readable exchange name
+    market_region: MarketRegion  # Geographic region
+    country_code: str  # ISO country code (e.g., "DE", "GB")
+
+    def __str__(self) -> str:
+        """String representation."""
+        return f"{self.yfinance_suffix} → {self.bloomberg_code} ({self.exchange_name})"
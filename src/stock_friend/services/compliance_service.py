@@ -109,7 +109,7 @@ class ComplianceService:
         if self.log_low_confidence and normalized.is_low_confidence():
             logger.warning(
                 f"LOW CONFIDENCE symbol mapping for {stock.ticker}: "
-                f"{'; '.join(normalized.transformation_notes)}"
+                f"{normalized.notes_text}"
             )
 
         # Check compliance with normalized symbol
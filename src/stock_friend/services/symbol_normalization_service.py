@@ -8,11 +8,13 @@ Critical for multi-exchange support and European market handling.
 """
 
 import logging
-import re
-from typing import Dict, List, Optional
+from dataclasses import replace
+from datetime import datetime
+from functools import lru_cache
+from typing import ClassVar, Dict, FrozenSet, List, Optional
 
 from stock_friend.models.symbol import (
-    ExchangeMapping,
+    ExchangeInfo,
     MarketRegion,
     NormalizedSymbol,
     SymbolConfidence,
@@ -50,49 +52,57 @@ class SymbolNormalizationService:
     """
 
     # Exchange mappings: yfinance suffix → exchange information
-    EXCHANGE_MAPPINGS: List[ExchangeMapping] = [
+    EXCHANGE_MAPPINGS: List[ExchangeInfo] = [
         # German Markets
-        ExchangeMapping(".DE", "XETR", "Deutsche Börse Xetra", MarketRegion.EU, "DE"),
-        ExchangeMapping(".F", "XFRA", "Frankfurt Stock Exchange", MarketRegion.EU, "DE"),
-        ExchangeMapping(".BE", "XBER", "Berlin Stock Exchange", MarketRegion.EU, "DE"),
-        ExchangeMapping(".MU", "XMUN", "Munich Stock Exchange", MarketRegion.EU, "DE"),
-        ExchangeMapping(".DU", "XDUS", "Düsseldorf Stock Exchange", MarketRegion.EU, "DE"),
-        ExchangeMapping(".HM", "XHAM", "Hamburg Stock Exchange", MarketRegion.EU, "DE"),
-        ExchangeMapping(".HA", "XHAN", "Hanover Stock Exchange", MarketRegion.EU, "DE"),
-        ExchangeMapping(".SG", "XSTU", "Stuttgart Stock Exchange", MarketRegion.EU, "DE"),
+        ExchangeInfo(".DE", "XETR", "Deutsche Börse Xetra", MarketRegion.EU, "DE"),
+        ExchangeInfo(".F", "XFRA", "Frankfurt Stock Exchange", MarketRegion.EU, "DE"),
+        ExchangeInfo(".BE", "XBER", "Berlin Stock Exchange", MarketRegion.EU, "DE"),
+        ExchangeInfo(".MU", "XMUN", "Munich Stock Exchange", MarketRegion.EU, "DE"),
+        ExchangeInfo(".DU", "XDUS", "Düsseldorf Stock Exchange", MarketRegion.EU, "DE"),
+        ExchangeInfo(".HM", "XHAM", "Hamburg Stock Exchange", MarketRegion.EU, "DE"),
+        ExchangeInfo(".HA", "XHAN", "Hanover Stock Exchange", MarketRegion.EU, "DE"),
+        ExchangeInfo(".SG", "XSTU", "Stuttgart Stock Exchange", MarketRegion.EU, "DE"),
         # UK Markets
-        ExchangeMapping(".L", "XLON", "London Stock Exchange", MarketRegion.UK, "GB"),
+        ExchangeInfo(".L", "XLON", "London Stock Exchange", MarketRegion.UK, "GB"),
         # Euronext Markets
-        ExchangeMapping(".PA", "XPAR", "Euronext Paris", MarketRegion.EU, "FR"),
-        ExchangeMapping(".AS", "XAMS", "Euronext Amsterdam", MarketRegion.EU, "NL"),
-        ExchangeMapping(".BR", "XBRU", "Euronext Brussels", MarketRegion.EU, "BE"),
-        ExchangeMapping(".LS", "XLIS", "Euronext Lisbon", MarketRegion.EU, "PT"),
+        ExchangeInfo(".PA", "XPAR", "Euronext Paris", MarketRegion.EU, "FR"),
+        ExchangeInfo(".AS", "XAMS", "Euronext Amsterdam", MarketRegion.EU, "NL"),
+        ExchangeInfo(".BR", "XBRU", "Euronext Brussels", MarketRegion.EU, "BE"),
+        ExchangeInfo(".LS", "XLIS", "Euronext Lisbon", MarketRegion.EU, "PT"),
         # Italian Markets
-        ExchangeMapping(".MI", "XMIL", "Borsa Italiana (Milan)", MarketRegion.EU, "IT"),
+        ExchangeInfo(".MI", "XMIL", "Borsa Italiana (Milan)", MarketRegion.EU, "IT"),
         # Swiss Markets
-        ExchangeMapping(".SW", "XSWX", "SIX Swiss Exchange", MarketRegion.EU, "CH"),
+        ExchangeInfo(".SW", "XSWX", "SIX Swiss Exchange", MarketRegion.EU, "CH"),
         # Nordic Markets
-        ExchangeMapping(".ST", "XSTO", "Nasdaq Stockholm", MarketRegion.EU, "SE"),
-        ExchangeMapping(".CO", "XCSE", "Nasdaq Copenhagen", MarketRegion.EU, "DK"),
-        ExchangeMapping(".HE", "XHEL", "Nasdaq Helsinki", MarketRegion.EU, "FI"),
-        ExchangeMapping(".OL", "XOSL", "Oslo Stock Exchange", MarketRegion.EU, "NO"),
+        ExchangeInfo(".ST", "XSTO", "Nasdaq Stockholm", MarketRegion.EU, "SE"),
+        ExchangeInfo(".CO", "XCSE", "Nasdaq Copenhagen", MarketRegion.EU, "DK"),
+        ExchangeInfo(".HE", "XHEL", "Nasdaq Helsinki", MarketRegion.EU, "FI"),
+        ExchangeInfo(".OL", "XOSL", "Oslo Stock Exchange", MarketRegion.EU, "NO"),
         # Spanish Markets
-        ExchangeMapping(".MC", "XMAD", "Bolsa de Madrid", MarketRegion.EU, "ES"),
+        ExchangeInfo(".MC", "XMAD", "Bolsa de Madrid", MarketRegion.EU, "ES"),
         # Austrian Markets
-        ExchangeMapping(".VI", "XWBO", "Vienna Stock Exchange", MarketRegion.EU, "AT"),
+        ExchangeInfo(".VI", "XWBO", "Vienna Stock Exchange", MarketRegion.EU, "AT"),
         # Asian Markets
-        ExchangeMapping(".HK", "XHKG", "Hong Kong Stock Exchange", MarketRegion.ASIA, "HK"),
-        ExchangeMapping(".T", "XTKS", "Tokyo Stock Exchange", MarketRegion.ASIA, "JP"),
-        ExchangeMapping(".KS", "XKRX", "Korea Stock Exchange", MarketRegion.ASIA, "KR"),
-        ExchangeMapping(".SS", "XSHG", "Shanghai Stock Exchange", MarketRegion.ASIA, "CN"),
-        ExchangeMapping(".SZ", "XSHE", "Shenzhen Stock Exchange", MarketRegion.ASIA, "CN"),
+        ExchangeInfo(".HK", "XHKG", "Hong Kong Stock Exchange", MarketRegion.ASIA, "HK"),
+        ExchangeInfo(".T", "XTKS", "Tokyo Stock Exchange", MarketRegion.ASIA, "JP"),
+        ExchangeInfo(".KS", "XKRX", "Korea Stock Exchange", MarketRegion.ASIA, "KR"),
+        ExchangeInfo(".SS", "XSHG", "Shanghai Stock Exchange", MarketRegion.ASIA, "CN"),
+        ExchangeInfo(".SZ", "XSHE", "Shenzhen Stock Exchange", MarketRegion.ASIA, "CN"),
         # Australian Markets
-        ExchangeMapping(".AX", "XASX", "Australian Securities Exchange", MarketRegion.OTHER, "AU"),
+        ExchangeInfo(".AX", "XASX", "Australian Securities Exchange", MarketRegion.OTHER, "AU"),
         # Canadian Markets
-        ExchangeMapping(".TO", "XTSE", "Toronto Stock Exchange", MarketRegion.OTHER, "CA"),
-        ExchangeMapping(".V", "XTSX", "TSX Venture Exchange", MarketRegion.OTHER, "CA"),
+        ExchangeInfo(".TO", "XTSE", "Toronto Stock Exchange", MarketRegion.OTHER, "CA"),
+        ExchangeInfo(".V", "XTSX", "TSX Venture Exchange", MarketRegion.OTHER, "CA"),
     ]
 
+    # Fast lookup dictionaries, built once at import from EXCHANGE_MAPPINGS
+    _SUFFIX_MAP: ClassVar[Dict[str, ExchangeInfo]] = {
+        mapping.yfinance_suffix: mapping for mapping in EXCHANGE_MAPPINGS
+    }
+    _BLOOMBERG_REVERSE_MAP: ClassVar[Dict[str, ExchangeInfo]] = {
+        mapping.bloomberg_code: mapping for mapping in EXCHANGE_MAPPINGS
+    }
+
     # US exchanges have no suffix in yfinance
     US_EXCHANGE_CODES = {
         "NASDAQ": "XNGS",  # NASDAQ Global Select
@@ -103,25 +113,26 @@ class SymbolNormalizationService:
     }
 
     # Special suffixes to preserve (not exchange codes)
-    PRESERVE_SUFFIXES = {
+    PRESERVE_SUFFIXES: FrozenSet[str] = frozenset({
         ".A", ".B", ".C", ".D",  # Share classes (e.g., BRK.A, GOOGL.A)
         "-A", "-B", "-C", "-D",  # Preferred shares (e.g., BAC-PL)
         ".PR",  # Preferred (alternative format)
         ".U", ".UN",  # Units (trusts, SPACs)
         ".W", ".WS",  # Warrants
         ".R", ".RT",  # Rights
-    }
+    })
 
     def __init__(self):
         """Initialize symbol normalization service."""
-        # Build fast lookup dictionaries
-        self._suffix_map: Dict[str, ExchangeMapping] = {
-            mapping.yfinance_suffix: mapping for mapping in self.EXCHANGE_MAPPINGS
-        }
+        # Lookup dictionaries are built once per class; instances share them read-only
+        self._suffix_map = self._SUFFIX_MAP
+        self._bloomberg_reverse_map = self._BLOOMBERG_REVERSE_MAP
 
-        self._bloomberg_reverse_map: Dict[str, ExchangeMapping] = {
-            mapping.bloomberg_code: mapping for mapping in self.EXCHANGE_MAPPINGS
-        }
+        # Suffix classification is pure for a given ticker, so memoize the
+        # helpers every public method goes through (per instance, not per class)
+        self._extract_exchange_suffix = lru_cache(maxsize=4096)(self._extract_exchange_suffix)
+        self._get_preserved_suffix = lru_cache(maxsize=4096)(self._get_preserved_suffix)
+        self._normalize = lru_cache(maxsize=8192)(self._normalize)
 
         logger.info(
             f"Initialized SymbolNormalizationService with {len(self._suffix_map)} exchange mappings"
@@ -153,6 +164,39 @@ class SymbolNormalizationService:
             SymbolConfidence.HIGH
         """
         ticker = ticker.strip().upper()
+
+        # Nothing to look up for empty/whitespace input; flag it for review
+        if not ticker:
+            return NormalizedSymbol(
+                base_symbol="",
+                original_ticker="",
+                exchange_code=None,
+                market_region=MarketRegion.OTHER,
+                confidence=SymbolConfidence.LOW,
+                transformation_notes=["Empty ticker"],
+                source_gateway=source_gateway,
+            )
+
+        # The cached result is shared, so hand out a copy stamped with this call's time
+        # with its own notes list (replace() is shallow and would alias the cached one)
+        normalized = self._normalize(ticker, exchange, source_gateway)
+        return replace(
+            normalized,
+            timestamp=datetime.now(),
+            transformation_notes=list(normalized.transformation_notes),
+        )
+
+    def _normalize(
+        self,
+        ticker: str,
+        exchange: Optional[str],
+        source_gateway: str,
+    ) -> NormalizedSymbol:
+        """
+        Build the NormalizedSymbol for an already stripped, uppercased ticker.
+
+        Memoized per instance in __init__; callers must not mutate the result.
+        """
         notes: List[str] = []
 
         # Check for special suffixes to preserve
@@ -234,6 +278,8 @@ class SymbolNormalizationService:
             'BRK.A'
         """
         ticker = ticker.strip().upper()
+        if not ticker:
+            return ticker
 
         # Check if has preserved suffix
         if self._get_preserved_suffix(ticker):
@@ -264,7 +310,7 @@ class SymbolNormalizationService:
             None
         """
         exchange_suffix = self._extract_exchange_suffix(ticker.upper())
-        if exchange_suffix and exchange_suffix in self._suffix_map:
+        if exchange_suffix:
             return self._suffix_map[exchange_suffix].bloomberg_code
         return None
 
@@ -280,7 +326,7 @@ class SymbolNormalizationService:
             MarketRegion enum value
         """
         exchange_suffix = self._extract_exchange_suffix(ticker.upper())
-        if exchange_suffix and exchange_suffix in self._suffix_map:
+        if exchange_suffix:
             return self._suffix_map[exchange_suffix].market_region
 
         if exchange and exchange.upper() in self.US_EXCHANGE_CODES.values():
@@ -296,15 +342,14 @@ class SymbolNormalizationService:
         Returns:
             Exchange suffix (e.g., ".DE") or None
         """
-        ticker = ticker.upper()
+        # Every exchange suffix is a single ".XX" segment, so one hash probe on
+        # the text after the last dot replaces scanning all known suffixes
+        _, dot, tail = ticker.upper().rpartition(".")
+        if not dot:
+            return None
 
-        # Check against known exchange suffixes (longest first to handle .WS before .W)
-        sorted_suffixes = sorted(self._suffix_map.keys(), key=len, reverse=True)
-        for suffix in sorted_suffixes:
-            if ticker.endswith(suffix):
-                return suffix
-
-        return None
+        suffix = f".{tail}"
+        return suffix if suffix in self._suffix_map else None
 
     def _get_preserved_suffix(self, ticker: str) -> Optional[str]:
         """
@@ -315,9 +360,12 @@ class SymbolNormalizationService:
         """
         ticker = ticker.upper()
 
-        for suffix in self.PRESERVE_SUFFIXES:
-            if ticker.endswith(suffix):
-                return suffix
+        # Preserved suffixes are a single ".X" or "-X" segment, so probe the
+        # text after the last dot and after the last hyphen
+        for separator in (".", "-"):
+            _, found, tail = ticker.rpartition(separator)
+            if found and f"{separator}{tail}" in self.PRESERVE_SUFFIXES:
+                return f"{separator}{tail}"
 
         return None
 
@@ -348,16 +396,16 @@ class SymbolNormalizationService:
 
         return None
 
-    def get_supported_exchanges(self) -> List[ExchangeMapping]:
+    def get_supported_exchanges(self) -> List[ExchangeInfo]:
         """
         Get list of all supported exchange mappings.
 
         Returns:
-            List of ExchangeMapping objects
+            List of ExchangeInfo objects
         """
         return self.EXCHANGE_MAPPINGS.copy()
 
-    def get_exchange_info(self, suffix_or_code: str) -> Optional[ExchangeMapping]:
+    def get_exchange_info(self, suffix_or_code: str) -> Optional[ExchangeInfo]:
         """
         Get exchange information by suffix or Bloomberg code.
 
@@ -365,7 +413,7 @@ class SymbolNormalizationService:
             suffix_or_code: yfinance suffix (e.g., ".DE") or Bloomberg code (e.g., "XETR")
 
         Returns:
-            ExchangeMapping or None if not found
+            ExchangeInfo or None if not found
         """
         suffix_or_code = suffix_or_code.upper()
 
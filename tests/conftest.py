@@ -0,0 +1,50 @@
+"""
+Shared pytest fixtures.
+
+Session-scoped reference data for gateway tests. Fixtures here are built
+once per run and must be treated as read-only; info dicts are exposed as
+read-only mappings so accidental mutation fails loudly.
+"""
+
+from types import MappingProxyType
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture(scope="session")
+def sample_ohlcv_df():
+    """Create sample OHLCV DataFrame in yfinance column layout."""
+    dates = pd.date_range(start="2025-01-01", periods=5, freq="D")
+    return pd.DataFrame(
+        {
+            "Date": dates,
+            "Open": [100.0, 101.0, 102.0, 103.0, 104.0],
+            "High": [105.0, 106.0, 107.0, 108.0, 109.0],
+            "Low": [95.0, 96.0, 97.0, 98.0, 99.0],
+            "Close": [102.0, 103.0, 104.0, 105.0, 106.0],
+            "Volume": [1000000, 1100000, 1200000, 1300000, 1400000],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def apple_info():
+    """Provide a yfinance-style info mapping with AAPL fundamentals."""
+    return MappingProxyType(
+        {
+            "longName": "Apple Inc.",
+            "sector": "Technology",
+            "industry": "Consumer Electronics",
+            "marketCap": 3000000000000,
+            "trailingPE": 30.5,
+            "priceToBook": 40.2,
+            "trailingEps": 6.11,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def apple_price_info():
+    """Provide a yfinance-style info mapping with only the AAPL current price."""
+    return MappingProxyType({"currentPrice": 150.50})
@@ -0,0 +1,32 @@
+"""
+In-memory cache fake for testing.
+
+Provides a dict-backed stand-in for CacheManager so service tests can
+exercise caching without opening a diskcache/SQLite store.
+"""
+
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+
+class InMemoryCache:
+    """
+    Dict-backed fake exposing the CacheManager get/set/clear surface.
+
+    TTLs are accepted but ignored; entries live until clear() is called.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Any] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if the key is not cached."""
+        return self._data.get(key)
+
+    def set(self, key: str, value: Any, ttl: timedelta) -> None:
+        """Store value under key (ttl is ignored)."""
+        self._data[key] = value
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
@@ -0,0 +1,47 @@
+"""
+Environment isolation helpers for settings tests.
+
+Provides a context manager that sets exactly the given settings env vars
+without snapshotting the whole process environment.
+"""
+
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+import pytest
+
+# env_prefix of every BaseSettings group aggregated by ApplicationConfig
+SETTINGS_ENV_PREFIXES = (
+    "MARKET_DATA_",
+    "CACHE_",
+    "DATABASE_",
+    "LOG_",
+    "RATE_LIMIT_",
+    "COMPLIANCE_",
+)
+
+
+def clear_settings_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Remove every settings-prefixed env var through the given monkeypatch."""
+    for key in [k for k in os.environ if k.upper().startswith(SETTINGS_ENV_PREFIXES)]:
+        monkeypatch.delenv(key)
+
+
+@contextmanager
+def settings_env(**env: str) -> Iterator[None]:
+    """
+    Apply exactly the given settings env vars for the duration of the block.
+
+    Only settings-prefixed variables are removed and only the given ones are
+    set, so restoring on exit touches those keys rather than all of os.environ.
+
+    Example:
+        >>> with settings_env(MARKET_DATA_PROVIDER="yfinance"):
+        ...     config = ApplicationConfig(_env_file=None)
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        clear_settings_env(mp)
+        for key, value in env.items():
+            mp.setenv(key, value)
+        yield
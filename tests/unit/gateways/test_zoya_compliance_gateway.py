@@ -17,13 +17,76 @@ from stock_friend.gateways.compliance import (
 )
 from stock_friend.infrastructure.cache_manager import CacheManager
 from stock_friend.infrastructure.rate_limiter import RateLimiter
-from stock_friend.models.compliance import ComplianceStatus
+from stock_friend.models.compliance import ComplianceReport, ComplianceStatus
+from tests.fixtures.in_memory_cache import InMemoryCache
 
 # Test URLs
 SANDBOX_URL = "https://sandbox-api.zoya.finance/graphql"
 LIVE_URL = "https://api.zoya.finance/graphql"
 
 
+def last_payload(mock_post):
+    """Return the JSON payload of the most recent mocked Session.post call."""
+    return mock_post.call_args.kwargs["json"]
+
+
+def last_query(mock_post):
+    """Return the GraphQL query text of the most recent mocked Session.post call."""
+    return last_payload(mock_post)["query"]
+
+
+def reports_by_symbol(reports):
+    """
+    Build a Session.post side effect answering report queries by symbol.
+
+    check_batch issues lookups concurrently, so responses must be keyed by the
+    requested symbol rather than by call order. Unlisted symbols are not found.
+    """
+
+    def side_effect(*args, **kwargs):
+        symbol = kwargs["json"]["variables"]["symbol"]
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {
+            "data": {"basicCompliance": {"report": reports.get(symbol)}}
+        }
+        return response
+
+    return side_effect
+
+
+@pytest.fixture(scope="module")
+def stock_reports_response():
+    """Single-page stock reports response (AAPL, MSFT) shared by pagination tests."""
+    return {
+        "data": {
+            "basicCompliance": {
+                "reports": {
+                    "items": [
+                        {
+                            "symbol": "AAPL",
+                            "name": "Apple Inc.",
+                            "exchange": "NASDAQ",
+                            "status": "COMPLIANT",
+                            "reportDate": "2026-01-01",
+                            "purificationRatio": 0.01,
+                        },
+                        {
+                            "symbol": "MSFT",
+                            "name": "Microsoft Corporation",
+                            "exchange": "NASDAQ",
+                            "status": "COMPLIANT",
+                            "reportDate": "2026-01-01",
+                            "purificationRatio": 0.02,
+                        },
+                    ],
+                    "nextToken": None,  # No more pages
+                }
+            }
+        }
+    }
+
+
 class TestZoyaComplianceGatewayInitialization:
     """Test gateway initialization scenarios."""
 
@@ -38,6 +101,7 @@ class TestZoyaComplianceGatewayInitialization:
         assert gateway.environment == "sandbox"
         assert gateway.api_url == SANDBOX_URL
         assert gateway.cache_ttl_days == 30
+        assert gateway.max_workers == 4
         assert gateway.get_name() == "zoya_sandbox"
 
     def test_init_with_live_environment(self):
@@ -135,7 +199,7 @@ class TestCheckCompliance:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
@@ -169,7 +233,7 @@ class TestCheckCompliance:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
@@ -197,7 +261,7 @@ class TestCheckCompliance:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
@@ -223,7 +287,7 @@ class TestCheckCompliance:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
@@ -243,7 +307,7 @@ class TestCheckCompliance:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
@@ -267,7 +331,7 @@ class TestCheckCompliance:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
@@ -288,7 +352,7 @@ class TestCheckCompliance:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
@@ -317,7 +381,7 @@ class TestCheckCompliance:
             cache_manager=mock_cache,
         )
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             status = gateway_with_cache.check_compliance("AAPL")
 
             assert status is cached_status
@@ -347,7 +411,7 @@ class TestCheckCompliance:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
@@ -380,7 +444,7 @@ class TestCheckCompliance:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
@@ -388,9 +452,23 @@ class TestCheckCompliance:
 
             mock_rate_limiter.acquire.assert_called_once_with("zoya")
 
+    def test_check_sends_shared_query_with_symbol_variable(self, gateway):
+        """Test that the hoisted query is sent with only the symbol varying."""
+        mock_response = {"data": {"basicCompliance": {"report": None}}}
+
+        with patch("requests.Session.post") as mock_post:
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.json.return_value = mock_response
+
+            gateway.check_compliance("AAPL")
+
+            payload = last_payload(mock_post)
+            assert payload["query"] is ZoyaComplianceGateway.BASIC_REPORT_QUERY
+            assert payload["variables"] == {"symbol": "AAPL"}
+
     def test_check_api_error_returns_unknown_status(self, gateway):
         """Test that API errors return unknown status after retries."""
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = requests.exceptions.RequestException("Network error")
 
             with patch("time.sleep"):  # Mock sleep to speed up test
@@ -413,7 +491,7 @@ class TestCheckCompliance:
             ]
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
@@ -432,33 +510,14 @@ class TestCheckBatch:
     def test_check_batch_mixed_tickers(self, gateway):
         """Test batch check with mix of compliant and non-compliant stocks."""
         # check_batch calls check_compliance for each ticker individually
-        responses = [
-            {
-                "data": {
-                    "basicCompliance": {
-                        "report": {"symbol": "AAPL", "status": "compliant", "purificationRatio": 0.01}
-                    }
-                }
-            },
-            {
-                "data": {
-                    "basicCompliance": {
-                        "report": {"symbol": "JPM", "status": "not-compliant", "purificationRatio": 0.0}
-                    }
-                }
-            },
-            {
-                "data": {
-                    "basicCompliance": {
-                        "report": {"symbol": "GOOGL", "status": "compliant", "purificationRatio": 0.02}
-                    }
-                }
-            },
-        ]
+        reports = {
+            "AAPL": {"symbol": "AAPL", "status": "compliant", "purificationRatio": 0.01},
+            "JPM": {"symbol": "JPM", "status": "not-compliant", "purificationRatio": 0.0},
+            "GOOGL": {"symbol": "GOOGL", "status": "compliant", "purificationRatio": 0.02},
+        }
 
-        with patch("requests.post") as mock_post:
-            mock_post.return_value.status_code = 200
-            mock_post.return_value.json.side_effect = responses
+        with patch("requests.Session.post") as mock_post:
+            mock_post.side_effect = reports_by_symbol(reports)
 
             tickers = ["AAPL", "JPM", "GOOGL"]
             results = gateway.check_batch(tickers)
@@ -471,33 +530,12 @@ class TestCheckBatch:
     def test_check_batch_with_unknown_tickers(self, gateway):
         """Test batch check with tickers not found in Zoya."""
         # check_batch calls check_compliance for each ticker individually
-        responses = [
-            {
-                "data": {
-                    "basicCompliance": {
-                        "report": {"symbol": "AAPL", "status": "compliant", "purificationRatio": 0.01}
-                    }
-                }
-            },
-            {
-                "data": {
-                    "basicCompliance": {
-                        "report": None  # Not found
-                    }
-                }
-            },
-            {
-                "data": {
-                    "basicCompliance": {
-                        "report": None  # Not found
-                    }
-                }
-            },
-        ]
+        reports = {
+            "AAPL": {"symbol": "AAPL", "status": "compliant", "purificationRatio": 0.01},
+        }
 
-        with patch("requests.post") as mock_post:
-            mock_post.return_value.status_code = 200
-            mock_post.return_value.json.side_effect = responses
+        with patch("requests.Session.post") as mock_post:
+            mock_post.side_effect = reports_by_symbol(reports)
 
             tickers = ["AAPL", "NOTFOUND1", "NOTFOUND2"]
             results = gateway.check_batch(tickers)
@@ -508,6 +546,39 @@ class TestCheckBatch:
             assert results["NOTFOUND2"].is_compliant is None  # Unknown
             assert "Not found in Zoya database" in results["NOTFOUND1"].reasons[0]
 
+    def test_check_batch_preserves_input_order(self, gateway):
+        """Test concurrent batch check returns results in input order."""
+        tickers = ["MSFT", "AAPL", "JPM", "GOOGL", "AMZN", "TSLA"]
+        reports = {
+            ticker: {"symbol": ticker, "status": "compliant"} for ticker in tickers
+        }
+
+        with patch("requests.Session.post") as mock_post:
+            mock_post.side_effect = reports_by_symbol(reports)
+
+            results = gateway.check_batch(tickers)
+
+            assert list(results) == tickers
+            assert mock_post.call_count == len(tickers)
+
+    def test_check_batch_uses_injected_executor(self):
+        """Test that a shared executor is used instead of a per-call pool."""
+        executor = Mock()
+        executor.map.side_effect = lambda fn, items: map(fn, items)
+        gateway_with_executor = ZoyaComplianceGateway(
+            api_key="sandbox-test-key",
+            api_url=SANDBOX_URL,
+            executor=executor,
+        )
+
+        with patch("requests.Session.post") as mock_post:
+            mock_post.side_effect = reports_by_symbol({})
+
+            results = gateway_with_executor.check_batch(["AAPL", "MSFT"])
+
+            assert list(results) == ["AAPL", "MSFT"]
+            executor.map.assert_called_once()
+
     def test_check_batch_empty_list(self, gateway):
         """Test batch check with empty list."""
         results = gateway.check_batch([])
@@ -517,26 +588,13 @@ class TestCheckBatch:
     def test_check_batch_normalizes_case(self, gateway):
         """Test batch check normalizes ticker case."""
         # check_batch calls check_compliance for each ticker individually
-        responses = [
-            {
-                "data": {
-                    "basicCompliance": {
-                        "report": {"symbol": "AAPL", "status": "compliant", "purificationRatio": 0.01}
-                    }
-                }
-            },
-            {
-                "data": {
-                    "basicCompliance": {
-                        "report": {"symbol": "GOOGL", "status": "compliant", "purificationRatio": 0.02}
-                    }
-                }
-            },
-        ]
+        reports = {
+            "AAPL": {"symbol": "AAPL", "status": "compliant", "purificationRatio": 0.01},
+            "GOOGL": {"symbol": "GOOGL", "status": "compliant", "purificationRatio": 0.02},
+        }
 
-        with patch("requests.post") as mock_post:
-            mock_post.return_value.status_code = 200
-            mock_post.return_value.json.side_effect = responses
+        with patch("requests.Session.post") as mock_post:
+            mock_post.side_effect = reports_by_symbol(reports)
 
             tickers = ["aapl", "GOOGL"]
             results = gateway.check_batch(tickers)
@@ -569,7 +627,7 @@ class TestCheckBatch:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
@@ -585,7 +643,7 @@ class TestCheckBatch:
 
     def test_check_batch_api_error_returns_unknown_for_all(self, gateway):
         """Test batch check returns unknown for all tickers on API error."""
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = requests.exceptions.RequestException("Network error")
 
             tickers = ["AAPL", "GOOGL", "MSFT"]
@@ -607,33 +665,14 @@ class TestFilterCompliant:
     def test_filter_compliant_basic(self, gateway):
         """Test filtering compliant stocks from mixed list."""
         # filter_compliant calls check_batch which calls check_compliance for each ticker
-        responses = [
-            {
-                "data": {
-                    "basicCompliance": {
-                        "report": {"symbol": "AAPL", "status": "compliant", "purificationRatio": 0.01}
-                    }
-                }
-            },
-            {
-                "data": {
-                    "basicCompliance": {
-                        "report": {"symbol": "JPM", "status": "not-compliant", "purificationRatio": 0.0}
-                    }
-                }
-            },
-            {
-                "data": {
-                    "basicCompliance": {
-                        "report": {"symbol": "GOOGL", "status": "compliant", "purificationRatio": 0.02}
-                    }
-                }
-            },
-        ]
+        reports = {
+            "AAPL": {"symbol": "AAPL", "status": "compliant", "purificationRatio": 0.01},
+            "JPM": {"symbol": "JPM", "status": "not-compliant", "purificationRatio": 0.0},
+            "GOOGL": {"symbol": "GOOGL", "status": "compliant", "purificationRatio": 0.02},
+        }
 
-        with patch("requests.post") as mock_post:
-            mock_post.return_value.status_code = 200
-            mock_post.return_value.json.side_effect = responses
+        with patch("requests.Session.post") as mock_post:
+            mock_post.side_effect = reports_by_symbol(reports)
 
             tickers = ["AAPL", "JPM", "GOOGL"]
             compliant = gateway.filter_compliant(tickers)
@@ -646,33 +685,12 @@ class TestFilterCompliant:
     def test_filter_compliant_excludes_unknown(self, gateway):
         """Test filtering excludes unknown tickers (conservative screening)."""
         # filter_compliant calls check_batch which calls check_compliance for each ticker
-        responses = [
-            {
-                "data": {
-                    "basicCompliance": {
-                        "report": {"symbol": "AAPL", "status": "compliant", "purificationRatio": 0.01}
-                    }
-                }
-            },
-            {
-                "data": {
-                    "basicCompliance": {
-                        "report": None  # Not found
-                    }
-                }
-            },
-            {
-                "data": {
-                    "basicCompliance": {
-                        "report": None  # Not found
-                    }
-                }
-            },
-        ]
+        reports = {
+            "AAPL": {"symbol": "AAPL", "status": "compliant", "purificationRatio": 0.01},
+        }
 
-        with patch("requests.post") as mock_post:
-            mock_post.return_value.status_code = 200
-            mock_post.return_value.json.side_effect = responses
+        with patch("requests.Session.post") as mock_post:
+            mock_post.side_effect = reports_by_symbol(reports)
 
             tickers = ["AAPL", "NOTFOUND", "JPM"]
             compliant = gateway.filter_compliant(tickers)
@@ -731,7 +749,7 @@ class TestExecuteGraphQL:
             "data": {"report": {"symbol": "AAPL", "status": "compliant"}}
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response_data
 
@@ -744,15 +762,15 @@ class TestExecuteGraphQL:
             # Verify request details
             mock_post.assert_called_once()
             call_kwargs = mock_post.call_args[1]
-            assert call_kwargs["json"]["query"] == query
-            assert call_kwargs["json"]["variables"] == variables
-            assert call_kwargs["headers"]["Authorization"] == "sandbox-test-key"
-            assert call_kwargs["headers"]["Content-Type"] == "application/json"
+            assert last_payload(mock_post) == {"query": query, "variables": variables}
             assert call_kwargs["timeout"] == 30
+            # Auth headers live on the shared session rather than each request
+            assert gateway._session.headers["Authorization"] == "sandbox-test-key"
+            assert gateway._session.headers["Content-Type"] == "application/json"
 
     def test_execute_graphql_http_error(self, gateway):
         """Test GraphQL execution with HTTP error."""
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 401
             mock_post.return_value.text = "Unauthorized"
 
@@ -770,7 +788,7 @@ class TestExecuteGraphQL:
             ]
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response_data
 
@@ -780,6 +798,93 @@ class TestExecuteGraphQL:
             with pytest.raises(ComplianceException, match="GraphQL errors"):
                 gateway._execute_graphql(query, variables)
 
+    def test_execute_graphql_retries_after_throttling(self, gateway):
+        """Test that 429 responses are retried after the Retry-After delay."""
+        throttled = Mock(status_code=429, headers={"Retry-After": "2"})
+        ok = Mock(status_code=200, headers={})
+        ok.json.return_value = {"data": {"report": None}}
+
+        with patch("requests.Session.post", side_effect=[throttled, ok]) as mock_post:
+            with patch("time.sleep") as mock_sleep:
+                result = gateway._execute_graphql("query Test { report { symbol } }", {})
+
+            assert result == {"data": {"report": None}}
+            assert mock_post.call_count == 2
+            mock_sleep.assert_called_once_with(2.0)
+
+    def test_execute_graphql_caps_large_retry_after(self, gateway):
+        """Test that an hour-long Retry-After is clamped to MAX_RETRY_AFTER_SECONDS."""
+        throttled = Mock(status_code=429, headers={"Retry-After": "3600"})
+        ok = Mock(status_code=200, headers={})
+        ok.json.return_value = {"data": {"report": None}}
+
+        with patch("requests.Session.post", side_effect=[throttled, ok]):
+            with patch("time.sleep") as mock_sleep:
+                gateway._execute_graphql("query Test { report { symbol } }", {})
+
+        mock_sleep.assert_called_once_with(gateway.MAX_RETRY_AFTER_SECONDS)
+
+    def test_execute_graphql_backs_off_exponentially_without_retry_after(self, gateway):
+        """Test that 429s without Retry-After back off 2**attempt plus jitter."""
+        throttled = Mock(status_code=429, headers={})
+        ok = Mock(status_code=200, headers={})
+        ok.json.return_value = {"data": {"report": None}}
+
+        with patch("requests.Session.post", side_effect=[throttled, throttled, ok]) as mock_post:
+            with patch("random.uniform", return_value=0.5), patch("time.sleep") as mock_sleep:
+                result = gateway._execute_graphql("query Test { report { symbol } }", {})
+
+            assert result == {"data": {"report": None}}
+            assert mock_post.call_count == 3
+            assert [c.args[0] for c in mock_sleep.call_args_list] == [2.5, 4.5]
+
+    def test_execute_graphql_gives_up_after_max_throttle_attempts(self, gateway):
+        """Test that persistent throttling raises after MAX_THROTTLE_ATTEMPTS posts."""
+        throttled = Mock(status_code=429, headers={"Retry-After": "1"}, text="Too Many Requests")
+
+        with patch("requests.Session.post", return_value=throttled) as mock_post:
+            with patch("time.sleep") as mock_sleep:
+                with pytest.raises(ComplianceException, match="Zoya API request failed: 429"):
+                    gateway._execute_graphql("query Test { report { symbol } }", {})
+
+            assert mock_post.call_count == gateway.MAX_THROTTLE_ATTEMPTS
+            # No sleep after the final attempt
+            assert mock_sleep.call_count == gateway.MAX_THROTTLE_ATTEMPTS - 1
+
+    def test_execute_graphql_acquires_token_per_attempt(self):
+        """Test that throttled retries go through the rate limiter too."""
+        mock_rate_limiter = Mock(spec=RateLimiter)
+        gateway_with_limiter = ZoyaComplianceGateway(
+            api_key="sandbox-test-key",
+            api_url=SANDBOX_URL,
+            rate_limiter=mock_rate_limiter,
+        )
+        throttled = Mock(status_code=429, headers={"Retry-After": "0"})
+        ok = Mock(status_code=200, headers={})
+        ok.json.return_value = {"data": {}}
+
+        with patch("requests.Session.post", side_effect=[throttled, ok]):
+            with patch("time.sleep"):
+                gateway_with_limiter._execute_graphql("query Test { report { symbol } }", {})
+
+        assert mock_rate_limiter.acquire.call_count == 2
+
+    def test_execute_graphql_records_rate_limit_headers(self):
+        """Test that server-reported remaining budget lowers local tokens."""
+        rate_limiter = RateLimiter()
+        gateway_with_limiter = ZoyaComplianceGateway(
+            api_key="sandbox-test-key",
+            api_url=SANDBOX_URL,
+            rate_limiter=rate_limiter,
+        )
+        response = Mock(status_code=200, headers={"x-ratelimit-remaining-requests": "5"})
+        response.json.return_value = {"data": {}}
+
+        with patch("requests.Session.post", return_value=response):
+            gateway_with_limiter._execute_graphql("query Test { report { symbol } }", {})
+
+        assert rate_limiter.get_available_tokens("zoya") == 5
+
 
 class TestRetryLogic:
     """Test retry logic with exponential backoff."""
@@ -813,7 +918,7 @@ class TestRetryLogic:
                 response.json.return_value = mock_response
                 return response
 
-        with patch("requests.post", side_effect=mock_post_side_effect):
+        with patch("requests.Session.post", side_effect=mock_post_side_effect):
             with patch("time.sleep"):  # Mock sleep to speed up test
                 status = gateway.check_compliance("AAPL")
 
@@ -830,7 +935,7 @@ class TestRetryLogic:
             call_count += 1
             raise requests.exceptions.ConnectionError("Network error")
 
-        with patch("requests.post", side_effect=mock_post_side_effect):
+        with patch("requests.Session.post", side_effect=mock_post_side_effect):
             with patch("time.sleep"):  # Mock sleep to speed up test
                 status = gateway.check_compliance("AAPL")
 
@@ -853,54 +958,107 @@ class TestGetName:
         assert gateway.get_name() == "zoya_live"
 
 
+class TestSession:
+    """Test shared HTTP session handling."""
+
+    def test_session_reused_across_requests(self):
+        """Test that every request goes through the same pooled session."""
+        gateway = ZoyaComplianceGateway(api_key="sandbox-test-key", api_url=SANDBOX_URL)
+        mock_response = {"data": {"basicCompliance": {"report": None}}}
+
+        with patch.object(gateway._session, "post") as mock_post:
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.json.return_value = mock_response
+
+            gateway.check_compliance("AAPL")
+            gateway.check_compliance("MSFT")
+
+            assert mock_post.call_count == 2
+
+    def test_close_closes_session(self):
+        """Test that close() releases the session."""
+        gateway = ZoyaComplianceGateway(api_key="sandbox-test-key", api_url=SANDBOX_URL)
+
+        with patch.object(gateway._session, "close") as mock_close:
+            gateway.close()
+
+            mock_close.assert_called_once()
+
+
 class TestGetAllReports:
     """Test get_all_reports method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def gateway(self):
-        """Create gateway for testing."""
+        """
+        Create gateway shared by every test in this class.
+
+        Safe to share because HTTP is patched per test and these tests never
+        mutate gateway state. Tests that inspect rate limiter calls build their
+        own gateway_with_limiter so mock call counts don't leak between tests.
+        """
         return ZoyaComplianceGateway(api_key="sandbox-test-key", api_url=SANDBOX_URL)
 
-    def test_get_all_reports_single_page(self, gateway):
-        """Test fetching all reports with single page of results."""
+    @pytest.mark.parametrize(
+        "asset_type,status_filter,items,expected_symbols,expected_query_fragment",
+        [
+            pytest.param(
+                "stock",
+                None,
+                [
+                    {"symbol": "AAPL", "status": "COMPLIANT"},
+                    {"symbol": "MSFT", "status": "COMPLIANT"},
+                ],
+                ["AAPL", "MSFT"],
+                None,
+                id="single_page",
+            ),
+            pytest.param(
+                "stock",
+                "COMPLIANT",
+                [
+                    {"symbol": "AAPL", "status": "COMPLIANT"},
+                    {"symbol": "MSFT", "status": "COMPLIANT"},
+                ],
+                ["AAPL", "MSFT"],
+                # Status filter is passed inline in the GraphQL query
+                "filters: { status: COMPLIANT }",
+                id="with_status_filter",
+            ),
+            pytest.param(
+                "fund",
+                None,
+                [
+                    {"symbol": "UMMA", "name": "Wahed ETF", "status": "COMPLIANT"},
+                    {"symbol": "HLAL", "name": "Wahed FTSE", "status": "COMPLIANT"},
+                ],
+                ["UMMA", "HLAL"],
+                "funds {",
+                id="funds",
+            ),
+            pytest.param("stock", None, [], [], None, id="empty_results"),
+        ],
+    )
+    def test_get_all_reports_single_page(
+        self, gateway, asset_type, status_filter, items, expected_symbols, expected_query_fragment
+    ):
+        """Test fetching all reports when the first page is the last page."""
+        field_name = "reports" if asset_type == "stock" else "funds"
         mock_response = {
-            "data": {
-                "basicCompliance": {
-                    "reports": {
-                        "items": [
-                            {
-                                "symbol": "AAPL",
-                                "name": "Apple Inc.",
-                                "exchange": "NASDAQ",
-                                "status": "COMPLIANT",
-                                "reportDate": "2026-01-01",
-                                "purificationRatio": 0.01,
-                            },
-                            {
-                                "symbol": "MSFT",
-                                "name": "Microsoft Corporation",
-                                "exchange": "NASDAQ",
-                                "status": "COMPLIANT",
-                                "reportDate": "2026-01-01",
-                                "purificationRatio": 0.02,
-                            },
-                        ],
-                        "nextToken": None,  # No more pages
-                    }
-                }
-            }
+            "data": {"basicCompliance": {field_name: {"items": items, "nextToken": None}}}
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
-            results = gateway.get_all_reports(asset_type="stock")
+            results = gateway.get_all_reports(asset_type=asset_type, status_filter=status_filter)
 
-            assert len(results) == 2
-            assert results[0]["symbol"] == "AAPL"
-            assert results[1]["symbol"] == "MSFT"
+            assert [item.symbol for item in results] == expected_symbols
+            assert all(isinstance(item, ComplianceReport) for item in results)
             assert mock_post.call_count == 1  # Single page
+            if expected_query_fragment:
+                assert expected_query_fragment in last_query(mock_post)
 
     def test_get_all_reports_multiple_pages(self, gateway):
         """Test fetching all reports with pagination."""
@@ -933,49 +1091,18 @@ class TestGetAllReports:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.side_effect = [mock_response_page1, mock_response_page2]
 
             results = gateway.get_all_reports(asset_type="stock")
 
             assert len(results) == 3
-            assert results[0]["symbol"] == "AAPL"
-            assert results[1]["symbol"] == "MSFT"
-            assert results[2]["symbol"] == "GOOGL"
+            assert results[0].symbol == "AAPL"
+            assert results[1].symbol == "MSFT"
+            assert results[2].symbol == "GOOGL"
             assert mock_post.call_count == 2  # Two pages
 
-    def test_get_all_reports_with_status_filter(self, gateway):
-        """Test fetching reports with status filter."""
-        mock_response = {
-            "data": {
-                "basicCompliance": {
-                    "reports": {
-                        "items": [
-                            {"symbol": "AAPL", "status": "COMPLIANT"},
-                            {"symbol": "MSFT", "status": "COMPLIANT"},
-                        ],
-                        "nextToken": None,
-                    }
-                }
-            }
-        }
-
-        with patch("requests.post") as mock_post:
-            mock_post.return_value.status_code = 200
-            mock_post.return_value.json.return_value = mock_response
-
-            results = gateway.get_all_reports(
-                asset_type="stock",
-                status_filter="COMPLIANT",
-            )
-
-            assert len(results) == 2
-            # Verify status filter was passed inline in GraphQL query
-            call_args = mock_post.call_args[1]["json"]
-            query = call_args["query"]
-            assert "filters: { status: COMPLIANT }" in query
-
     def test_get_all_reports_with_max_items_limit(self, gateway):
         """Test fetching reports with max_items limit."""
         mock_response = {
@@ -993,69 +1120,53 @@ class TestGetAllReports:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
             results = gateway.get_all_reports(asset_type="stock", max_items=2)
 
             assert len(results) == 2  # Limited to max_items
-            assert results[0]["symbol"] == "AAPL"
-            assert results[1]["symbol"] == "MSFT"
+            assert results[0].symbol == "AAPL"
+            assert results[1].symbol == "MSFT"
             assert mock_post.call_count == 1  # Stopped after first page
 
-    def test_get_all_reports_funds(self, gateway):
-        """Test fetching fund reports."""
-        mock_response = {
+    def test_get_all_reports_max_items_spanning_pages(self, gateway):
+        """Test max_items truncates within the page that reaches the limit."""
+        mock_response_page1 = {
             "data": {
                 "basicCompliance": {
-                    "funds": {
-                        "items": [
-                            {"symbol": "UMMA", "name": "Wahed ETF", "status": "COMPLIANT"},
-                            {"symbol": "HLAL", "name": "Wahed FTSE", "status": "COMPLIANT"},
-                        ],
-                        "nextToken": None,
+                    "reports": {
+                        "items": [{"symbol": "AAPL"}, {"symbol": "MSFT"}],
+                        "nextToken": "page2_token",
                     }
                 }
             }
         }
-
-        with patch("requests.post") as mock_post:
-            mock_post.return_value.status_code = 200
-            mock_post.return_value.json.return_value = mock_response
-
-            results = gateway.get_all_reports(asset_type="fund")
-
-            assert len(results) == 2
-            assert results[0]["symbol"] == "UMMA"
-            assert results[1]["symbol"] == "HLAL"
-
-    def test_get_all_reports_invalid_asset_type(self, gateway):
-        """Test that invalid asset_type raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid asset_type"):
-            gateway.get_all_reports(asset_type="invalid")
-
-    def test_get_all_reports_empty_results(self, gateway):
-        """Test fetching reports with no results."""
-        mock_response = {
+        mock_response_page2 = {
             "data": {
                 "basicCompliance": {
                     "reports": {
-                        "items": [],
-                        "nextToken": None,
+                        "items": [{"symbol": "GOOGL"}, {"symbol": "AMZN"}],
+                        "nextToken": "page3_token",
                     }
                 }
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
-            mock_post.return_value.json.return_value = mock_response
+            mock_post.return_value.json.side_effect = [mock_response_page1, mock_response_page2]
 
-            results = gateway.get_all_reports(asset_type="stock")
+            results = gateway.get_all_reports(asset_type="stock", max_items=3)
 
-            assert len(results) == 0
-            assert mock_post.call_count == 1
+            assert [item.symbol for item in results] == ["AAPL", "MSFT", "GOOGL"]
+            assert mock_post.call_count == 2  # Third page never requested
+
+    def test_get_all_reports_invalid_asset_type(self, gateway):
+        """Test that invalid asset_type raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid asset_type"):
+            gateway.get_all_reports(asset_type="invalid")
 
     def test_get_all_reports_applies_rate_limiting(self):
         """Test that rate limiting is applied during pagination."""
@@ -1089,7 +1200,7 @@ class TestGetAllReports:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.side_effect = [mock_response_page1, mock_response_page2]
 
@@ -1098,9 +1209,115 @@ class TestGetAllReports:
             assert len(results) == 2
             assert mock_rate_limiter.acquire.call_count == 2  # Once per page
 
+    def test_get_all_reports_bypasses_cache_by_default(self, stock_reports_response):
+        """Test that bulk pulls are fetched live unless caching is requested."""
+        mock_cache = Mock(spec=CacheManager)
+        gateway_with_cache = ZoyaComplianceGateway(
+            api_key="sandbox-test-key",
+            api_url=SANDBOX_URL,
+            cache_manager=mock_cache,
+        )
+
+        with patch("requests.Session.post") as mock_post:
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.json.return_value = stock_reports_response
+
+            gateway_with_cache.get_all_reports(asset_type="stock")
+
+            assert mock_post.call_count == 1
+        mock_cache.get.assert_not_called()
+        mock_cache.set.assert_not_called()
+
+    def test_get_all_reports_caches_pages(self, stock_reports_response):
+        """Test that fetched pages are cached with the gateway TTL."""
+        mock_cache = Mock(spec=CacheManager)
+        mock_cache.get.return_value = None  # Cache miss
+        gateway_with_cache = ZoyaComplianceGateway(
+            api_key="sandbox-test-key",
+            api_url=SANDBOX_URL,
+            cache_manager=mock_cache,
+        )
+
+        with patch("requests.Session.post") as mock_post:
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.json.return_value = stock_reports_response
+
+            gateway_with_cache.get_all_reports(
+                asset_type="stock", status_filter="COMPLIANT", use_cache=True
+            )
+
+        mock_cache.set.assert_called_once()
+        call_args = mock_cache.set.call_args
+        assert call_args[0][0] == "compliance:zoya:sandbox:reports:stock:COMPLIANT:first"
+        assert call_args[1]["ttl"] == timedelta(days=30)
+
+    def test_get_all_reports_serves_cached_pages(self):
+        """Test that cached pages are returned without API calls."""
+        mock_cache = Mock(spec=CacheManager)
+        mock_cache.get.return_value = {
+            "items": [ComplianceReport(symbol="AAPL", status="COMPLIANT")],
+            "nextToken": None,
+        }
+        gateway_with_cache = ZoyaComplianceGateway(
+            api_key="sandbox-test-key",
+            api_url=SANDBOX_URL,
+            cache_manager=mock_cache,
+        )
+
+        with patch("requests.Session.post") as mock_post:
+            results = gateway_with_cache.get_all_reports(asset_type="stock", use_cache=True)
+
+            assert [item.symbol for item in results] == ["AAPL"]
+            mock_post.assert_not_called()
+
+    def test_get_all_reports_refetches_only_evicted_page(self):
+        """Test an evicted page is refetched with the token its cached predecessor points to."""
+        cache = InMemoryCache()
+        gateway_with_cache = ZoyaComplianceGateway(
+            api_key="sandbox-test-key",
+            api_url=SANDBOX_URL,
+            cache_manager=cache,
+        )
+
+        def page(symbol, next_token):
+            return {
+                "data": {
+                    "basicCompliance": {
+                        "reports": {
+                            "items": [{"symbol": symbol, "status": "COMPLIANT"}],
+                            "nextToken": next_token,
+                        }
+                    }
+                }
+            }
+
+        with patch("requests.Session.post") as mock_post:
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.json.side_effect = [
+                page("AAPL", "page2_token"),
+                page("MSFT", "page3_token"),
+                page("GOOGL", None),
+            ]
+            first_pull = gateway_with_cache.get_all_reports(asset_type="stock", use_cache=True)
+
+        # Evict the middle page only (e.g. size-limit eviction or an earlier expiry)
+        cache._data.pop("compliance:zoya:sandbox:reports:stock:None:page2_token")
+
+        with patch("requests.Session.post") as mock_post:
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.json.return_value = page("MSFT", "page3_token")
+            second_pull = gateway_with_cache.get_all_reports(asset_type="stock", use_cache=True)
+
+            # Only the evicted page is requested, using the token that led to it
+            assert mock_post.call_count == 1
+            assert 'nextToken: "page2_token"' in last_query(mock_post)
+
+        assert [r.symbol for r in first_pull] == ["AAPL", "MSFT", "GOOGL"]
+        assert [r.symbol for r in second_pull] == ["AAPL", "MSFT", "GOOGL"]
+
     def test_get_all_reports_api_error_raises_exception(self, gateway):
         """Test that API errors raise ComplianceException."""
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = requests.exceptions.RequestException("Network error")
 
             with pytest.raises(ComplianceException, match="Failed to fetch all reports"):
@@ -1110,9 +1327,15 @@ class TestGetAllReports:
 class TestFetchReportsPage:
     """Test _fetch_reports_page method."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def gateway(self):
-        """Create gateway for testing."""
+        """
+        Create gateway shared by every test in this class.
+
+        Safe to share because HTTP is patched per test and these tests never
+        mutate gateway state. Tests that inspect rate limiter calls build their
+        own gateway_with_limiter so mock call counts don't leak between tests.
+        """
         return ZoyaComplianceGateway(api_key="sandbox-test-key", api_url=SANDBOX_URL)
 
     def test_fetch_reports_page_stocks(self, gateway):
@@ -1131,7 +1354,7 @@ class TestFetchReportsPage:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
@@ -1139,7 +1362,28 @@ class TestFetchReportsPage:
 
             assert len(result["items"]) == 2
             assert result["nextToken"] == "next_page_token"
-            assert result["items"][0]["symbol"] == "AAPL"
+            assert result["items"][0].symbol == "AAPL"
+
+    def test_fetch_reports_page_maps_items_to_reports(self, gateway, stock_reports_response):
+        """Test that Zoya's camelCase items become ComplianceReport objects."""
+        with patch("requests.Session.post") as mock_post:
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.json.return_value = stock_reports_response
+
+            result = gateway._fetch_reports_page(asset_type="stock")
+
+            report = result["items"][0]
+            assert report == ComplianceReport(
+                symbol="AAPL",
+                name="Apple Inc.",
+                exchange="NASDAQ",
+                status="COMPLIANT",
+                report_date="2026-01-01",
+                purification_ratio=0.01,
+            )
+            assert report.to_dict() == stock_reports_response["data"]["basicCompliance"][
+                "reports"
+            ]["items"][0]
 
     def test_fetch_reports_page_funds(self, gateway):
         """Test fetching a page of fund reports."""
@@ -1154,14 +1398,14 @@ class TestFetchReportsPage:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
             result = gateway._fetch_reports_page(asset_type="fund")
 
             assert len(result["items"]) == 1
-            assert result["items"][0]["symbol"] == "UMMA"
+            assert result["items"][0].symbol == "UMMA"
             assert result["nextToken"] is None
 
     def test_fetch_reports_page_with_status_filter(self, gateway):
@@ -1177,7 +1421,7 @@ class TestFetchReportsPage:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
@@ -1188,9 +1432,7 @@ class TestFetchReportsPage:
 
             assert len(result["items"]) == 1
             # Verify status filter was passed inline in GraphQL query
-            call_args = mock_post.call_args[1]["json"]
-            query = call_args["query"]
-            assert "filters: { status: COMPLIANT }" in query
+            assert "filters: { status: COMPLIANT }" in last_query(mock_post)
 
     def test_fetch_reports_page_with_next_token(self, gateway):
         """Test fetching page with pagination token."""
@@ -1205,7 +1447,7 @@ class TestFetchReportsPage:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
@@ -1216,15 +1458,13 @@ class TestFetchReportsPage:
 
             assert len(result["items"]) == 1
             # Verify nextToken was passed inline in GraphQL query
-            call_args = mock_post.call_args[1]["json"]
-            query = call_args["query"]
-            assert 'nextToken: "pagination_token"' in query
+            assert 'nextToken: "pagination_token"' in last_query(mock_post)
 
     def test_fetch_reports_page_no_data_returns_empty(self, gateway):
         """Test fetching page with no data returns empty result."""
         mock_response = {"data": {"basicCompliance": {}}}
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
@@ -1253,10 +1493,24 @@ class TestFetchReportsPage:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = mock_response
 
             gateway_with_limiter._fetch_reports_page(asset_type="stock")
 
             mock_rate_limiter.acquire.assert_called_once_with("zoya")
+
+    def test_fetch_reports_page_without_input_omits_arguments(self, gateway):
+        """Test that an unfiltered first page sends reports without arguments."""
+        mock_response = {"data": {"basicCompliance": {"reports": {"items": [], "nextToken": None}}}}
+
+        with patch("requests.Session.post") as mock_post:
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.json.return_value = mock_response
+
+            gateway._fetch_reports_page(asset_type="stock")
+
+            query = last_query(mock_post)
+            assert "reports {" in query
+            assert "input:" not in query
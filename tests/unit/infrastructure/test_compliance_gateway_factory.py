@@ -4,6 +4,7 @@ Unit tests for ComplianceGatewayFactory.
 Tests factory creation of compliance gateways with proper dependency injection.
 """
 
+import copy
 from unittest.mock import Mock, patch
 
 import pytest
@@ -12,6 +13,7 @@ from stock_friend.gateways.compliance import (
     StaticComplianceGateway,
     ZoyaComplianceGateway,
 )
+from stock_friend.gateways.compliance.base import IComplianceGateway
 from stock_friend.infrastructure.cache_manager import CacheManager
 from stock_friend.infrastructure.compliance_gateway_factory import (
     ComplianceGatewayFactory,
@@ -20,12 +22,23 @@ from stock_friend.infrastructure.config import ApplicationConfig
 from stock_friend.infrastructure.rate_limiter import RateLimiter
 
 
+@pytest.fixture(scope="module")
+def base_config():
+    """
+    Build ApplicationConfig once per module.
+
+    Read-only tests use it directly; tests that change settings mutate a
+    copy.deepcopy() of it so changes never leak between tests.
+    """
+    return ApplicationConfig()
+
+
 class TestComplianceGatewayFactoryInitialization:
     """Test factory initialization."""
 
-    def test_init_with_all_dependencies(self):
+    def test_init_with_all_dependencies(self, base_config):
         """Test initialization with all dependencies."""
-        config = ApplicationConfig()
+        config = base_config
         cache = Mock(spec=CacheManager)
         rate_limiter = Mock(spec=RateLimiter)
 
@@ -39,9 +52,9 @@ class TestComplianceGatewayFactoryInitialization:
         assert factory.cache_manager is cache
         assert factory.rate_limiter is rate_limiter
 
-    def test_init_with_optional_dependencies(self):
+    def test_init_with_optional_dependencies(self, base_config):
         """Test initialization with optional dependencies as None."""
-        config = ApplicationConfig()
+        config = base_config
 
         factory = ComplianceGatewayFactory(config=config)
 
@@ -53,9 +66,9 @@ class TestComplianceGatewayFactoryInitialization:
 class TestCreateStaticGateway:
     """Test static gateway creation."""
 
-    def test_create_static_gateway_default_provider(self):
+    def test_create_static_gateway_default_provider(self, base_config):
         """Test creating static gateway as default provider."""
-        config = ApplicationConfig()
+        config = copy.deepcopy(base_config)
         # Ensure static is the default
         config.compliance.provider = "static"
 
@@ -65,18 +78,18 @@ class TestCreateStaticGateway:
         assert isinstance(gateway, StaticComplianceGateway)
         assert gateway.get_name() == "static"
 
-    def test_create_static_gateway_explicit_provider(self):
+    def test_create_static_gateway_explicit_provider(self, base_config):
         """Test creating static gateway with explicit provider."""
-        config = ApplicationConfig()
+        config = base_config
         factory = ComplianceGatewayFactory(config=config)
 
         gateway = factory.create_gateway(provider="static")
 
         assert isinstance(gateway, StaticComplianceGateway)
 
-    def test_create_static_gateway_case_insensitive(self):
+    def test_create_static_gateway_case_insensitive(self, base_config):
         """Test provider name is case-insensitive."""
-        config = ApplicationConfig()
+        config = base_config
         factory = ComplianceGatewayFactory(config=config)
 
         gateway = factory.create_gateway(provider="STATIC")
@@ -87,9 +100,9 @@ class TestCreateStaticGateway:
 class TestCreateZoyaGateway:
     """Test Zoya gateway creation."""
 
-    def test_create_zoya_gateway_sandbox(self):
+    def test_create_zoya_gateway_sandbox(self, base_config):
         """Test creating Zoya gateway in sandbox environment."""
-        config = ApplicationConfig()
+        config = copy.deepcopy(base_config)
         config.compliance_zoya.api_key = "sandbox-test-key"
         config.compliance_zoya.environment = "sandbox"
         config.compliance_zoya.cache_ttl_days = 30
@@ -113,9 +126,9 @@ class TestCreateZoyaGateway:
         assert gateway.rate_limiter is rate_limiter
         assert gateway.cache_ttl_days == 30
 
-    def test_create_zoya_gateway_live(self):
+    def test_create_zoya_gateway_live(self, base_config):
         """Test creating Zoya gateway in live environment."""
-        config = ApplicationConfig()
+        config = copy.deepcopy(base_config)
         config.compliance_zoya.api_key = "live-test-key"
         config.compliance_zoya.environment = "live"
 
@@ -126,9 +139,9 @@ class TestCreateZoyaGateway:
         assert gateway.get_name() == "zoya_live"
         assert gateway.environment == "live"
 
-    def test_create_zoya_gateway_normalizes_environment_case(self):
+    def test_create_zoya_gateway_normalizes_environment_case(self, base_config):
         """Test that environment is normalized to lowercase."""
-        config = ApplicationConfig()
+        config = copy.deepcopy(base_config)
         config.compliance_zoya.api_key = "test-key"
         config.compliance_zoya.environment = "SANDBOX"
 
@@ -137,9 +150,9 @@ class TestCreateZoyaGateway:
 
         assert gateway.environment == "sandbox"
 
-    def test_create_zoya_gateway_missing_api_key_raises_error(self):
+    def test_create_zoya_gateway_missing_api_key_raises_error(self, base_config):
         """Test that missing API key raises ValueError."""
-        config = ApplicationConfig()
+        config = copy.deepcopy(base_config)
         config.compliance_zoya.api_key = ""  # Empty API key
 
         factory = ComplianceGatewayFactory(config=config)
@@ -147,9 +160,9 @@ class TestCreateZoyaGateway:
         with pytest.raises(ValueError, match="Zoya API key is required"):
             factory.create_gateway(provider="zoya")
 
-    def test_create_zoya_gateway_invalid_environment_raises_error(self):
+    def test_create_zoya_gateway_invalid_environment_raises_error(self, base_config):
         """Test that invalid environment raises ValueError."""
-        config = ApplicationConfig()
+        config = copy.deepcopy(base_config)
         config.compliance_zoya.api_key = "test-key"
         config.compliance_zoya.environment = "invalid"
 
@@ -162,9 +175,9 @@ class TestCreateZoyaGateway:
 class TestInvalidProvider:
     """Test invalid provider handling."""
 
-    def test_create_gateway_invalid_provider_raises_error(self):
+    def test_create_gateway_invalid_provider_raises_error(self, base_config):
         """Test that invalid provider raises ValueError."""
-        config = ApplicationConfig()
+        config = base_config
         factory = ComplianceGatewayFactory(config=config)
 
         with pytest.raises(ValueError, match="Unsupported compliance provider"):
@@ -173,14 +186,30 @@ class TestInvalidProvider:
     def test_supported_gateways_constant(self):
         """Test that SUPPORTED_GATEWAYS constant is correctly defined."""
         assert ComplianceGatewayFactory.SUPPORTED_GATEWAYS == {"static", "zoya"}
+        assert isinstance(ComplianceGatewayFactory.SUPPORTED_GATEWAYS, frozenset)
+        assert (
+            set(ComplianceGatewayFactory._BUILDERS) == ComplianceGatewayFactory.SUPPORTED_GATEWAYS
+        )
+
+    def test_create_gateway_dispatches_to_subclass_override(self, base_config):
+        """Test that subclasses can override a provider's builder method."""
+        sentinel = Mock(spec=IComplianceGateway)
+
+        class CustomFactory(ComplianceGatewayFactory):
+            def _create_static_gateway(self):
+                return sentinel
+
+        factory = CustomFactory(config=base_config)
+
+        assert factory.create_gateway(provider="static") is sentinel
 
 
 class TestProviderOverride:
     """Test provider override functionality."""
 
-    def test_create_gateway_uses_config_provider_by_default(self):
+    def test_create_gateway_uses_config_provider_by_default(self, base_config):
         """Test that create_gateway uses config provider when not specified."""
-        config = ApplicationConfig()
+        config = copy.deepcopy(base_config)
         config.compliance.provider = "static"
 
         factory = ComplianceGatewayFactory(config=config)
@@ -188,9 +217,9 @@ class TestProviderOverride:
 
         assert isinstance(gateway, StaticComplianceGateway)
 
-    def test_create_gateway_overrides_config_provider(self):
+    def test_create_gateway_overrides_config_provider(self, base_config):
         """Test that explicit provider overrides config provider."""
-        config = ApplicationConfig()
+        config = copy.deepcopy(base_config)
         config.compliance.provider = "static"
         config.compliance_zoya.api_key = "test-key"
         config.compliance_zoya.environment = "sandbox"
@@ -201,12 +230,35 @@ class TestProviderOverride:
         assert isinstance(gateway, ZoyaComplianceGateway)
 
 
+class TestGatewayCaching:
+    """Test optional per-provider gateway reuse."""
+
+    def test_gateways_not_cached_by_default(self, base_config):
+        """Test that each call builds a fresh gateway by default."""
+        factory = ComplianceGatewayFactory(config=base_config)
+
+        assert factory.create_gateway("static") is not factory.create_gateway("static")
+
+    def test_cache_gateways_reuses_instance_per_provider(self, base_config):
+        """Test that cache_gateways returns one instance per normalized provider."""
+        config = copy.deepcopy(base_config)
+        config.compliance.provider = "static"
+        config.compliance_zoya.api_key = "test-key"
+
+        factory = ComplianceGatewayFactory(config=config, cache_gateways=True)
+
+        static_gateway = factory.create_gateway()
+        assert factory.create_gateway("STATIC") is static_gateway
+        assert factory.create_gateway("zoya") is factory.create_gateway("zoya")
+        assert factory.create_gateway("zoya") is not static_gateway
+
+
 class TestDependencyInjection:
     """Test dependency injection into gateways."""
 
-    def test_static_gateway_no_dependencies_required(self):
+    def test_static_gateway_no_dependencies_required(self, base_config):
         """Test that static gateway can be created without cache/rate limiter."""
-        config = ApplicationConfig()
+        config = base_config
         factory = ComplianceGatewayFactory(config=config)
 
         gateway = factory.create_gateway(provider="static")
@@ -214,9 +266,9 @@ class TestDependencyInjection:
         # Should succeed without cache_manager or rate_limiter
         assert isinstance(gateway, StaticComplianceGateway)
 
-    def test_zoya_gateway_receives_dependencies(self):
+    def test_zoya_gateway_receives_dependencies(self, base_config):
         """Test that Zoya gateway receives injected dependencies."""
-        config = ApplicationConfig()
+        config = copy.deepcopy(base_config)
         config.compliance_zoya.api_key = "test-key"
 
         cache = Mock(spec=CacheManager)
@@ -235,9 +287,32 @@ class TestDependencyInjection:
         # Verify rate limiter was configured (called during __init__)
         rate_limiter.configure.assert_called_once()
 
-    def test_zoya_gateway_without_dependencies_still_works(self):
+    def test_zoya_gateways_share_factory_executor(self, base_config):
+        """Test that Zoya gateways reuse the factory's thread pool."""
+        config = copy.deepcopy(base_config)
+        config.compliance_zoya.api_key = "test-key"
+
+        factory = ComplianceGatewayFactory(config=config)
+        first = factory.create_gateway(provider="zoya")
+        second = factory.create_gateway(provider="zoya")
+
+        assert first.executor is factory._executor
+        assert second.executor is factory._executor
+
+        factory.shutdown()
+        assert "_executor" not in factory.__dict__
+
+    def test_shutdown_without_executor_is_noop(self, base_config):
+        """Test that shutdown does not create an executor just to close it."""
+        factory = ComplianceGatewayFactory(config=base_config)
+
+        factory.shutdown()
+
+        assert "_executor" not in factory.__dict__
+
+    def test_zoya_gateway_without_dependencies_still_works(self, base_config):
         """Test that Zoya gateway can be created without cache/rate limiter."""
-        config = ApplicationConfig()
+        config = copy.deepcopy(base_config)
         config.compliance_zoya.api_key = "test-key"
 
         factory = ComplianceGatewayFactory(config=config)
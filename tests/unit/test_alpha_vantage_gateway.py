@@ -4,15 +4,19 @@ Unit tests for AlphaVantageGateway.
 Tests the Alpha Vantage gateway implementation with mocked API responses.
 """
 
+import threading
 from datetime import datetime, timedelta
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
+from alpha_vantage.fundamentaldata import FundamentalData
+from alpha_vantage.timeseries import TimeSeries
 
+from stock_friend.gateways import alpha_vantage_gateway as avgw
 from stock_friend.gateways.alpha_vantage_gateway import AlphaVantageGateway
 from stock_friend.gateways.base import DataProviderException
+from stock_friend.infrastructure import rate_limiter as rate_limiter_module
 from stock_friend.infrastructure.cache_manager import CacheManager
 from stock_friend.infrastructure.rate_limiter import RateLimiter
 from tests.fixtures.mock_responses import (
@@ -23,19 +27,74 @@ from tests.fixtures.mock_responses import (
 )
 
 
-@pytest.fixture
-def mock_cache_manager(tmp_path):
-    """Create a CacheManager for testing."""
-    cache_dir = tmp_path / "cache"
+class _FakeClock:
+    """Thread-safe stand-in for the time module: sleep() advances monotonic()."""
+
+    def __init__(self):
+        self.t = 0.0
+        self._lock = threading.Lock()
+
+    def monotonic(self) -> float:
+        return self.t
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.t += seconds
+
+
+@pytest.fixture(autouse=True)
+def fake_clock(monkeypatch):
+    """Run retry backoff and rate limiting on a fake clock so tests never really sleep."""
+    clock = _FakeClock()
+    monkeypatch.setattr(avgw, "time", clock)
+    monkeypatch.setattr(rate_limiter_module, "time", clock)
+    return clock
+
+
+@pytest.fixture(scope="session")
+def _session_cache_manager(tmp_path_factory):
+    """Open one on-disk CacheManager for the whole test session."""
+    cache_dir = tmp_path_factory.mktemp("cache")
     return CacheManager(cache_dir=str(cache_dir), size_limit_mb=10)
 
 
+@pytest.fixture
+def mock_cache_manager(_session_cache_manager):
+    """Provide the shared CacheManager, emptied for per-test isolation."""
+    _session_cache_manager.clear()
+    return _session_cache_manager
+
+
+@pytest.fixture(scope="module")
+def aapl_daily_df():
+    """Build the mock AAPL daily frame once; the gateway never mutates it."""
+    return get_mock_daily_adjusted_data("AAPL")
+
+
 @pytest.fixture
 def mock_rate_limiter():
     """Create a RateLimiter for testing."""
     return RateLimiter()
 
 
+@pytest.fixture
+def mock_get_daily(mocker):
+    """Patch TimeSeries.get_daily_adjusted on the class imported once above."""
+    return mocker.patch.object(TimeSeries, "get_daily_adjusted")
+
+
+@pytest.fixture
+def mock_get_quote(mocker):
+    """Patch TimeSeries.get_quote_endpoint."""
+    return mocker.patch.object(TimeSeries, "get_quote_endpoint")
+
+
+@pytest.fixture
+def mock_get_overview(mocker):
+    """Patch FundamentalData.get_company_overview."""
+    return mocker.patch.object(FundamentalData, "get_company_overview")
+
+
 @pytest.fixture
 def gateway(mock_cache_manager, mock_rate_limiter):
     """Create AlphaVantageGateway for testing."""
@@ -82,12 +141,10 @@ class TestAlphaVantageGatewayInitialization:
 class TestGetStockData:
     """Test get_stock_data method."""
 
-    @patch("alpha_vantage.timeseries.TimeSeries.get_daily_adjusted")
-    def test_get_stock_data_success(self, mock_get_daily, gateway):
+    def test_get_stock_data_success(self, mock_get_daily, gateway, aapl_daily_df):
         """Test successful stock data retrieval."""
         # Setup mock response
-        mock_df = get_mock_daily_adjusted_data("AAPL")
-        mock_get_daily.return_value = (mock_df, {"Symbol": "AAPL"})
+        mock_get_daily.return_value = (aapl_daily_df, {"Symbol": "AAPL"})
 
         # Call gateway
         result = gateway.get_stock_data("AAPL")
@@ -104,12 +161,10 @@ class TestGetStockData:
         # Verify API was called
         mock_get_daily.assert_called_once()
 
-    @patch("alpha_vantage.timeseries.TimeSeries.get_daily_adjusted")
-    def test_get_stock_data_cached(self, mock_get_daily, gateway):
+    def test_get_stock_data_cached(self, mock_get_daily, gateway, aapl_daily_df):
         """Test stock data retrieval uses cache."""
         # Setup mock response
-        mock_df = get_mock_daily_adjusted_data("AAPL")
-        mock_get_daily.return_value = (mock_df, {"Symbol": "AAPL"})
+        mock_get_daily.return_value = (aapl_daily_df, {"Symbol": "AAPL"})
 
         # First call - should hit API
         result1 = gateway.get_stock_data("AAPL")
@@ -123,7 +178,6 @@ class TestGetStockData:
         assert result1.ticker == result2.ticker
         assert len(result1.data) == len(result2.data)
 
-    @patch("alpha_vantage.timeseries.TimeSeries.get_daily_adjusted")
     def test_get_stock_data_empty_response(self, mock_get_daily, gateway):
         """Test error handling when API returns empty data."""
         # Setup mock to return empty DataFrame
@@ -133,12 +187,10 @@ class TestGetStockData:
         with pytest.raises(DataProviderException, match="No data returned"):
             gateway.get_stock_data("INVALID")
 
-    @patch("alpha_vantage.timeseries.TimeSeries.get_daily_adjusted")
-    def test_get_stock_data_with_date_filter(self, mock_get_daily, gateway):
+    def test_get_stock_data_with_date_filter(self, mock_get_daily, gateway, aapl_daily_df):
         """Test stock data retrieval with date filtering."""
         # Setup mock response
-        mock_df = get_mock_daily_adjusted_data("AAPL")
-        mock_get_daily.return_value = (mock_df, {"Symbol": "AAPL"})
+        mock_get_daily.return_value = (aapl_daily_df, {"Symbol": "AAPL"})
 
         # Call with date range
         start_date = datetime.now() - timedelta(days=10)
@@ -149,7 +201,6 @@ class TestGetStockData:
         # Should filter data
         assert len(result.data) < 30  # Less than full dataset
 
-    @patch("alpha_vantage.timeseries.TimeSeries.get_daily_adjusted")
     def test_get_stock_data_api_error(self, mock_get_daily, gateway):
         """Test error handling when API raises exception."""
         # Setup mock to raise exception
@@ -163,7 +214,6 @@ class TestGetStockData:
 class TestGetCurrentPrice:
     """Test get_current_price method."""
 
-    @patch("alpha_vantage.timeseries.TimeSeries.get_quote_endpoint")
     def test_get_current_price_success(self, mock_get_quote, gateway):
         """Test successful current price retrieval."""
         # Setup mock response
@@ -180,7 +230,6 @@ class TestGetCurrentPrice:
         # Verify API was called
         mock_get_quote.assert_called_once()
 
-    @patch("alpha_vantage.timeseries.TimeSeries.get_quote_endpoint")
     def test_get_current_price_cached(self, mock_get_quote, gateway):
         """Test current price uses cache."""
         # Setup mock response
@@ -197,7 +246,6 @@ class TestGetCurrentPrice:
 
         assert result1 == result2
 
-    @patch("alpha_vantage.timeseries.TimeSeries.get_quote_endpoint")
     def test_get_current_price_empty_response(self, mock_get_quote, gateway):
         """Test error when quote returns empty data."""
         # Setup mock to return empty DataFrame
@@ -211,7 +259,6 @@ class TestGetCurrentPrice:
 class TestGetFundamentalData:
     """Test get_fundamental_data method."""
 
-    @patch("alpha_vantage.fundamentaldata.FundamentalData.get_company_overview")
     def test_get_fundamental_data_success(self, mock_get_overview, gateway):
         """Test successful fundamental data retrieval."""
         # Setup mock response
@@ -232,7 +279,6 @@ class TestGetFundamentalData:
         # Verify API was called
         mock_get_overview.assert_called_once()
 
-    @patch("alpha_vantage.fundamentaldata.FundamentalData.get_company_overview")
     def test_get_fundamental_data_cached(self, mock_get_overview, gateway):
         """Test fundamental data uses cache."""
         # Setup mock response
@@ -249,7 +295,6 @@ class TestGetFundamentalData:
 
         assert result1.ticker == result2.ticker
 
-    @patch("alpha_vantage.fundamentaldata.FundamentalData.get_company_overview")
     def test_get_fundamental_data_empty_response(self, mock_get_overview, gateway):
         """Test fundamental data returns None for empty response."""
         # Setup mock to return empty DataFrame
@@ -259,7 +304,6 @@ class TestGetFundamentalData:
         result = gateway.get_fundamental_data("INVALID")
         assert result is None
 
-    @patch("alpha_vantage.fundamentaldata.FundamentalData.get_company_overview")
     def test_get_fundamental_data_api_error(self, mock_get_overview, gateway):
         """Test fundamental data returns None on API error."""
         # Setup mock to raise exception
@@ -273,7 +317,6 @@ class TestGetFundamentalData:
 class TestBatchOperations:
     """Test batch operations."""
 
-    @patch("alpha_vantage.timeseries.TimeSeries.get_daily_adjusted")
     def test_get_batch_stock_data(self, mock_get_daily, gateway):
         """Test batch stock data retrieval."""
         # Setup mock to return different data for each ticker
@@ -286,16 +329,13 @@ class TestBatchOperations:
         tickers = ["AAPL", "MSFT", "GOOGL"]
         results = gateway.get_batch_stock_data(tickers)
 
-        # Assertions
-        assert len(results) == 3
-        assert "AAPL" in results
-        assert "MSFT" in results
-        assert "GOOGL" in results
+        # Fetches may run concurrently, so don't assume call order
+        assert set(results.keys()) == {"AAPL", "MSFT", "GOOGL"}
+        assert list(results) == tickers
 
         # Verify API was called for each ticker
         assert mock_get_daily.call_count == 3
 
-    @patch("alpha_vantage.timeseries.TimeSeries.get_quote_endpoint")
     def test_get_batch_current_prices(self, mock_get_quote, gateway):
         """Test batch current price retrieval."""
         # Setup mock
@@ -325,16 +365,68 @@ class TestRateLimiting:
         # Verify rate limiter has the alpha_vantage bucket
         assert "alpha_vantage" in mock_rate_limiter.buckets
 
-    @patch("alpha_vantage.timeseries.TimeSeries.get_daily_adjusted")
-    def test_rate_limiter_called(self, mock_get_daily, gateway):
+    def test_rate_limiter_called(self, mock_get_daily, gateway, aapl_daily_df):
         """Test rate limiter is invoked before API calls."""
         # Setup mock
-        mock_df = get_mock_daily_adjusted_data("AAPL")
-        mock_get_daily.return_value = (mock_df, {"Symbol": "AAPL"})
+        mock_get_daily.return_value = (aapl_daily_df, {"Symbol": "AAPL"})
 
         # Call gateway
         gateway.get_stock_data("AAPL")
 
         # Rate limiter should have consumed a token
         available_tokens = gateway.rate_limiter.get_available_tokens("alpha_vantage")
-        assert available_tokens < 300  # Should be less than initial capacity
+        capacity = gateway.rate_limiter.buckets["alpha_vantage"].capacity
+        assert available_tokens < capacity  # Should be less than initial capacity
+
+    def test_rate_limiter_matches_free_tier_quota(self, mock_rate_limiter):
+        """Test the bucket allows one minute's quota back-to-back, then 5 req/min."""
+        AlphaVantageGateway(api_key="test_key", rate_limiter=mock_rate_limiter)
+
+        bucket = mock_rate_limiter.buckets["alpha_vantage"]
+        assert bucket.capacity == 5
+        assert bucket.refill_rate * 60 == pytest.approx(5)
+
+    def test_detail_view_calls_do_not_wait(
+        self,
+        fake_clock,
+        mock_get_daily,
+        mock_get_quote,
+        mock_get_overview,
+        mock_rate_limiter,
+        aapl_daily_df,
+    ):
+        """Test a typical 3-call detail view fits in the burst without pacing."""
+        gateway = AlphaVantageGateway(api_key="test_key", rate_limiter=mock_rate_limiter)
+        mock_get_daily.return_value = (aapl_daily_df, {"Symbol": "AAPL"})
+        mock_get_quote.return_value = (get_mock_quote_data("AAPL"), {})
+        mock_get_overview.return_value = (get_mock_company_overview("AAPL"), {})
+
+        gateway.get_stock_data("AAPL")
+        gateway.get_current_price("AAPL")
+        gateway.get_fundamental_data("AAPL")
+
+        assert fake_clock.t == 0.0
+
+    def test_concurrent_batch_fetches_respect_rate_limit(
+        self, fake_clock, mock_get_daily, mock_rate_limiter
+    ):
+        """Test concurrent batch fetches never outrun burst + 5 req/min."""
+        gateway = AlphaVantageGateway(api_key="test_key", rate_limiter=mock_rate_limiter)
+
+        call_times = []
+
+        def mock_response(symbol, outputsize):
+            call_times.append(fake_clock.monotonic())
+            return (get_mock_daily_adjusted_data(symbol), {"Symbol": symbol})
+
+        mock_get_daily.side_effect = mock_response
+
+        tickers = ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META"]
+        results = gateway.get_batch_stock_data(tickers)
+
+        assert list(results) == tickers
+        # The n-th call may only happen once burst + elapsed * rate covers it
+        burst = AlphaVantageGateway.BURST
+        per_second = 300 / 3600.0
+        for n, called_at in enumerate(sorted(call_times), start=1):
+            assert n <= burst + called_at * per_second + 1e-9
@@ -5,7 +5,6 @@ Tests the chart presentation logic with mocked plotext calls.
 """
 
 from datetime import datetime
-from decimal import Decimal
 from unittest.mock import Mock, patch
 
 import pandas as pd
@@ -16,12 +15,43 @@ from stock_friend.models.stock_data import StockData
 from stock_friend.presenters.chart_presenter import ChartPresenter
 
 
-@pytest.fixture
+class _FakeConsole:
+    """Minimal Console stand-in exposing only what ChartPresenter reads."""
+
+    size = (120, 30)  # Terminal size (width, height)
+
+    def __init__(self):
+        self.print = Mock()
+
+
+@pytest.fixture(scope="module")
 def mock_console():
-    """Create a mock console."""
-    console = Mock(spec=Console)
-    console.size = (120, 30)  # Terminal size (width, height)
-    return console
+    """Create a lightweight fake console."""
+    return _FakeConsole()
+
+
+_DATES = pd.date_range(start="2024-11-01", periods=20, freq="D")
+
+PLT_CALLS = ("clf", "theme", "plotsize", "candlestick", "plot", "bar", "title", "show")
+
+
+def plt_call_counts(mock_plt) -> dict:
+    """Snapshot call counts of the plotext functions the presenter drives."""
+    return {name: getattr(mock_plt, name).call_count for name in PLT_CALLS}
+
+
+@pytest.fixture(scope="module")
+def _patched_plt():
+    """Patch plotext in the presenter module once for all tests here."""
+    with patch("stock_friend.presenters.chart_presenter.plt") as plt_mock:
+        yield plt_mock
+
+
+@pytest.fixture
+def mock_plt(_patched_plt):
+    """Provide the shared plotext mock with call history cleared."""
+    _patched_plt.reset_mock()
+    return _patched_plt
 
 
 @pytest.fixture
@@ -30,26 +60,57 @@ def chart_presenter(mock_console):
     return ChartPresenter(console=mock_console)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_stock_data():
-    """Create sample stock data for testing."""
+    """Create sample stock data once per module (validated once; never mutated)."""
+    steps = pd.RangeIndex(20)
     df = pd.DataFrame(
         {
-            "date": pd.date_range(start="2024-11-01", periods=20, freq="D"),
-            "open": [100.0 + i for i in range(20)],
-            "high": [105.0 + i for i in range(20)],
-            "low": [98.0 + i for i in range(20)],
-            "close": [102.0 + i for i in range(20)],
-            "volume": [1000000 + i * 10000 for i in range(20)],
+            "date": _DATES,
+            "open": 100.0 + steps,
+            "high": 105.0 + steps,
+            "low": 98.0 + steps,
+            "close": 102.0 + steps,
+            "volume": 1000000 + steps * 10000,
         }
     )
 
-    return StockData(
+    stock_data = StockData(
         ticker="AAPL",
         data=df,
         fetched_at=datetime.now(),
         source="YFINANCE",
     )
+    snapshot = df.copy()
+
+    yield stock_data
+
+    # Shared across the module, so fail loudly if any test mutated it
+    assert stock_data.data is df
+    pd.testing.assert_frame_equal(df, snapshot)
+
+
+def _df_missing_ohlv() -> pd.DataFrame:
+    """Frame with only date and close (missing open, high, low, volume)."""
+    return pd.DataFrame(
+        {
+            "date": _DATES[:5],
+            "close": [100.0, 101.0, 102.0, 103.0, 104.0],
+        }
+    )
+
+
+def _df_missing_volume() -> pd.DataFrame:
+    """Frame with full OHLC but no volume column."""
+    return pd.DataFrame(
+        {
+            "date": _DATES[:5],
+            "open": [100.0, 101.0, 102.0, 103.0, 104.0],
+            "high": [105.0, 106.0, 107.0, 108.0, 109.0],
+            "low": [98.0, 99.0, 100.0, 101.0, 102.0],
+            "close": [102.0, 103.0, 104.0, 105.0, 106.0],
+        }
+    )
 
 
 class TestChartPresenterInitialization:
@@ -70,86 +131,36 @@ class TestChartPresenterInitialization:
 class TestPresentPriceChart:
     """Test present_price_chart method."""
 
-    @patch("stock_friend.presenters.chart_presenter.plt")
-    def test_present_candlestick_chart(self, mock_plt, chart_presenter, sample_stock_data):
-        """Test candlestick chart display."""
+    @pytest.mark.parametrize(
+        "chart_type,expects_candle,expects_line",
+        [("candlestick", True, False), ("line", False, True), ("both", True, True)],
+    )
+    def test_present_chart_type(
+        self, mock_plt, chart_presenter, sample_stock_data, chart_type, expects_candle, expects_line
+    ):
+        """Test each chart type draws the expected series around a shared layout."""
         chart_presenter.present_price_chart(
             stock_data=sample_stock_data,
-            chart_type="candlestick",
+            chart_type=chart_type,
             period="1mo",
         )
 
-        # Verify plotext methods were called
-        mock_plt.clf.assert_called_once()
-        mock_plt.theme.assert_called_once_with("dark")
-        mock_plt.plotsize.assert_called_once()
-        mock_plt.candlestick.assert_called_once()
-        mock_plt.title.assert_called_once()
+        # Shared layout once, plus candlestick and/or closing price line
+        # (plotext shows legends automatically)
+        assert plt_call_counts(mock_plt) == {
+            "clf": 1,
+            "theme": 1,
+            "plotsize": 1,
+            "candlestick": int(expects_candle),
+            "plot": int(expects_line),
+            "bar": 0,
+            "title": 1,
+            "show": 1,
+        }
+        mock_plt.theme.assert_called_with("dark")
         mock_plt.xlabel.assert_called_once_with("Date")
         mock_plt.ylabel.assert_called_once_with("Price (USD)")
-        mock_plt.show.assert_called_once()
 
-    @patch("stock_friend.presenters.chart_presenter.plt")
-    def test_present_line_chart(self, mock_plt, chart_presenter, sample_stock_data):
-        """Test line chart display."""
-        chart_presenter.present_price_chart(
-            stock_data=sample_stock_data,
-            chart_type="line",
-            period="3mo",
-        )
-
-        # Verify plotext methods were called
-        mock_plt.clf.assert_called_once()
-        mock_plt.plot.assert_called_once()  # Only closing price line
-        # plotext shows legends automatically, no explicit legend() call
-        mock_plt.show.assert_called_once()
-
-    @patch("stock_friend.presenters.chart_presenter.plt")
-    def test_present_both_chart(self, mock_plt, chart_presenter, sample_stock_data):
-        """Test combined candlestick and line chart."""
-        chart_presenter.present_price_chart(
-            stock_data=sample_stock_data,
-            chart_type="both",
-            period="1y",
-        )
-
-        # Verify both candlestick and line plot were called
-        mock_plt.candlestick.assert_called_once()
-        mock_plt.plot.assert_called_once()
-        # plotext shows legends automatically, no explicit legend() call
-        mock_plt.show.assert_called_once()
-
-    def test_stockdata_validation_rejects_empty_data(self):
-        """Test that StockData validation rejects empty DataFrame."""
-        # StockData should raise ValueError for empty or invalid data
-        with pytest.raises(ValueError, match="Missing required columns"):
-            StockData(
-                ticker="EMPTY",
-                data=pd.DataFrame(),
-                fetched_at=datetime.now(),
-                source="YFINANCE",
-            )
-
-    def test_stockdata_validation_rejects_missing_columns(self):
-        """Test that StockData validation rejects missing columns."""
-        incomplete_df = pd.DataFrame(
-            {
-                "date": pd.date_range(start="2024-11-01", periods=5, freq="D"),
-                "close": [100.0, 101.0, 102.0, 103.0, 104.0],
-                # Missing: open, high, low, volume
-            }
-        )
-
-        # StockData __post_init__ should reject invalid data
-        with pytest.raises(ValueError, match="Missing required columns"):
-            StockData(
-                ticker="INCOMPLETE",
-                data=incomplete_df,
-                fetched_at=datetime.now(),
-                source="YFINANCE",
-            )
-
-    @patch("stock_friend.presenters.chart_presenter.plt")
     def test_present_chart_custom_dimensions(
         self, mock_plt, chart_presenter, sample_stock_data
     ):
@@ -168,7 +179,6 @@ class TestPresentPriceChart:
 class TestPresentVolumeChart:
     """Test present_volume_chart method."""
 
-    @patch("stock_friend.presenters.chart_presenter.plt")
     def test_present_volume_chart(self, mock_plt, chart_presenter, sample_stock_data):
         """Test volume bar chart display."""
         chart_presenter.present_volume_chart(
@@ -177,32 +187,35 @@ class TestPresentVolumeChart:
         )
 
         # Verify plotext methods for bar chart
-        mock_plt.clf.assert_called_once()
-        mock_plt.theme.assert_called_once_with("dark")
-        mock_plt.bar.assert_called_once()
-        mock_plt.title.assert_called_once()
+        assert plt_call_counts(mock_plt) == {
+            "clf": 1,
+            "theme": 1,
+            "plotsize": 1,
+            "candlestick": 0,
+            "plot": 0,
+            "bar": 1,
+            "title": 1,
+            "show": 1,
+        }
+        mock_plt.theme.assert_called_with("dark")
         mock_plt.xlabel.assert_called_once_with("Date")
         mock_plt.ylabel.assert_called_once_with("Volume")
-        mock_plt.show.assert_called_once()
-
-    def test_stockdata_validation_requires_volume(self):
-        """Test that StockData validation requires volume column."""
-        no_volume_df = pd.DataFrame(
-            {
-                "date": pd.date_range(start="2024-11-01", periods=5, freq="D"),
-                "open": [100.0, 101.0, 102.0, 103.0, 104.0],
-                "high": [105.0, 106.0, 107.0, 108.0, 109.0],
-                "low": [98.0, 99.0, 100.0, 101.0, 102.0],
-                "close": [102.0, 103.0, 104.0, 105.0, 106.0],
-                # Missing volume
-            }
-        )
 
-        # StockData __post_init__ should reject data without volume
+
+class TestStockDataValidation:
+    """Test StockData rejects frames the chart presenter cannot plot."""
+
+    @pytest.mark.parametrize(
+        "df_factory",
+        [pd.DataFrame, _df_missing_ohlv, _df_missing_volume],
+        ids=["empty", "missing_ohlv", "missing_volume"],
+    )
+    def test_stockdata_validation_rejects_invalid(self, df_factory):
+        """Test that StockData __post_init__ rejects missing required columns."""
         with pytest.raises(ValueError, match="Missing required columns"):
             StockData(
-                ticker="NOVOL",
-                data=no_volume_df,
+                ticker="INVALID",
+                data=df_factory(),
                 fetched_at=datetime.now(),
                 source="YFINANCE",
             )
@@ -211,7 +224,6 @@ class TestPresentVolumeChart:
 class TestDateFormatting:
     """Test date formatting for plotext."""
 
-    @patch("stock_friend.presenters.chart_presenter.plt")
     def test_date_formatting(self, mock_plt, chart_presenter, sample_stock_data):
         """Test that dates are properly formatted for plotext."""
         chart_presenter.present_price_chart(
@@ -222,25 +234,3 @@ class TestDateFormatting:
         # Verify datetimes_to_string was called
         mock_plt.datetimes_to_string.assert_called_once()
 
-
-class TestChartTypes:
-    """Test different chart type rendering."""
-
-    @patch("stock_friend.presenters.chart_presenter.plt")
-    def test_all_chart_types(self, mock_plt, chart_presenter, sample_stock_data):
-        """Test all three chart types render without errors."""
-        chart_types = ["candlestick", "line", "both"]
-
-        for chart_type in chart_types:
-            mock_plt.reset_mock()
-
-            chart_presenter.present_price_chart(
-                stock_data=sample_stock_data,
-                chart_type=chart_type,
-                period="1mo",
-            )
-
-            # All chart types should call show()
-            mock_plt.show.assert_called_once()
-            # All chart types should set title
-            mock_plt.title.assert_called_once()
@@ -5,187 +5,177 @@ Tests the GatewaySettings and ApplicationConfig classes with various
 environment variable combinations.
 """
 
-import os
+import re
+from functools import lru_cache
+from typing import Tuple, Type, TypeVar
+
 import pytest
-from unittest.mock import patch
 
 from stock_friend.infrastructure.config import GatewaySettings, ApplicationConfig
+from tests.fixtures.settings_env import settings_env
+
+T = TypeVar("T")
+
+_RE_MISSING_KEY = re.compile("MARKET_DATA_ALPHA_VANTAGE_API_KEY is required")
+_RE_INVALID_PROVIDER = re.compile("Invalid provider")
+
+
+@lru_cache(maxsize=None)
+def _build_cached(settings_cls: Type[T], env: Tuple[Tuple[str, str], ...]) -> T:
+    """Construct settings once per (class, env) under an isolated settings environment."""
+    with settings_env(**dict(env)):
+        return settings_cls(_env_file=None)
+
+
+def build_settings(settings_cls: Type[T], **env: str) -> T:
+    """
+    Return shared settings built from exactly the given env vars.
+
+    Tests only read the result, so identical env combinations reuse one
+    instance. Construction errors are not cached and re-raise every call.
+    """
+    return _build_cached(settings_cls, tuple(sorted(env.items())))
+
+
+class _InitOnlyGatewaySettings(GatewaySettings):
+    """GatewaySettings that reads only constructor kwargs (no env or .env file)."""
+
+    @classmethod
+    def settings_customise_sources(cls, settings_cls, init_settings, *args, **kwargs):
+        return (init_settings,)
+
+
+def make_settings(**overrides) -> GatewaySettings:
+    """
+    Build GatewaySettings from field values directly, bypassing env parsing.
+
+    Field validators still run; use build_settings for env-path tests.
+    """
+    return _InitOnlyGatewaySettings(**overrides)
+
+
+# (env vars, GatewaySettings attribute, expected value)
+_SETTING_CASES = [
+    ({}, "provider", "yfinance"),
+    ({}, "yfinance_rate_limit", 2000),
+    ({}, "alpha_vantage_api_key", None),
+    ({"MARKET_DATA_PROVIDER": "alpha_vantage"}, "provider", "alpha_vantage"),
+    ({"MARKET_DATA_PROVIDER": "YFINANCE"}, "provider", "yfinance"),
+    (
+        {"MARKET_DATA_ALPHA_VANTAGE_API_KEY": "test_key_12345"},
+        "alpha_vantage_api_key",
+        "test_key_12345",
+    ),
+    ({"MARKET_DATA_YFINANCE_RATE_LIMIT": "5000"}, "yfinance_rate_limit", 5000),
+]
+
+
+@pytest.fixture(scope="module")
+def default_config():
+    """ApplicationConfig built from an empty environment."""
+    return build_settings(ApplicationConfig)
 
 
 class TestGatewaySettings:
     """Test GatewaySettings configuration class."""
 
-    def test_default_provider_is_yfinance(self):
-        """Test that default provider is yfinance."""
-        with patch.dict(os.environ, {}, clear=True):
-            settings = GatewaySettings(_env_file=None)
-            assert settings.provider == "yfinance"
-
-    def test_default_yfinance_rate_limit(self):
-        """Test that default yfinance rate limit is 2000."""
-        with patch.dict(os.environ, {}, clear=True):
-            settings = GatewaySettings(_env_file=None)
-            assert settings.yfinance_rate_limit == 2000
-
-    def test_alpha_vantage_api_key_optional_by_default(self):
-        """Test that alpha_vantage_api_key is optional (None by default)."""
-        with patch.dict(os.environ, {}, clear=True):
-            settings = GatewaySettings(_env_file=None)
-            assert settings.alpha_vantage_api_key is None
-
-    def test_provider_from_env_variable(self):
-        """Test loading provider from MARKET_DATA_PROVIDER env variable."""
-        with patch.dict(os.environ, {"MARKET_DATA_PROVIDER": "alpha_vantage"}, clear=True):
-            settings = GatewaySettings(_env_file=None)
-            assert settings.provider == "alpha_vantage"
-
-    def test_provider_case_insensitive(self):
-        """Test that provider is case-insensitive."""
-        with patch.dict(os.environ, {"MARKET_DATA_PROVIDER": "YFINANCE"}, clear=True):
-            settings = GatewaySettings(_env_file=None)
-            assert settings.provider == "yfinance"
+    @pytest.mark.parametrize(
+        "env,attr,expected",
+        _SETTING_CASES,
+        ids=[
+            "default_provider",
+            "default_rate_limit",
+            "default_api_key_none",
+            "provider_from_env",
+            "provider_case_insensitive",
+            "api_key_from_env",
+            "rate_limit_from_env",
+        ],
+    )
+    def test_setting_from_env(self, env, attr, expected):
+        """Test each setting resolves from env vars (or its default when unset)."""
+        settings = build_settings(GatewaySettings, **env)
+        assert getattr(settings, attr) == expected
 
     def test_invalid_provider_raises_error(self):
         """Test that invalid provider raises ValueError."""
-        with patch.dict(os.environ, {"MARKET_DATA_PROVIDER": "invalid_provider"}, clear=True):
-            with pytest.raises(ValueError, match="Invalid provider"):
-                GatewaySettings(_env_file=None)
-
-    def test_alpha_vantage_api_key_from_env(self):
-        """Test loading Alpha Vantage API key from env variable."""
-        with patch.dict(
-            os.environ,
-            {"MARKET_DATA_ALPHA_VANTAGE_API_KEY": "test_key_12345"},
-            clear=True,
-        ):
-            settings = GatewaySettings(_env_file=None)
-            assert settings.alpha_vantage_api_key == "test_key_12345"
-
-    def test_yfinance_rate_limit_from_env(self):
-        """Test loading YFinance rate limit from env variable."""
-        with patch.dict(os.environ, {"MARKET_DATA_YFINANCE_RATE_LIMIT": "5000"}, clear=True):
-            settings = GatewaySettings(_env_file=None)
-            assert settings.yfinance_rate_limit == 5000
+        with pytest.raises(ValueError, match=_RE_INVALID_PROVIDER):
+            build_settings(GatewaySettings, MARKET_DATA_PROVIDER="invalid_provider")
 
     def test_yfinance_rate_limit_must_be_positive(self):
         """Test that yfinance_rate_limit must be >= 1."""
-        with patch.dict(os.environ, {"MARKET_DATA_YFINANCE_RATE_LIMIT": "0"}, clear=True):
-            with pytest.raises(ValueError):
-                GatewaySettings(_env_file=None)
+        with pytest.raises(ValueError):
+            build_settings(GatewaySettings, MARKET_DATA_YFINANCE_RATE_LIMIT="0")
 
     def test_validate_config_yfinance_no_api_key_required(self):
         """Test that yfinance provider doesn't require API key."""
-        with patch.dict(os.environ, {"MARKET_DATA_PROVIDER": "yfinance"}, clear=True):
-            settings = GatewaySettings(_env_file=None)
-            # Should not raise
-            settings.validate_config()
+        settings = make_settings(provider="yfinance")
+        # Should not raise
+        settings.validate_config()
 
     def test_validate_config_alpha_vantage_requires_api_key(self):
         """Test that alpha_vantage provider requires API key."""
-        with patch.dict(os.environ, {"MARKET_DATA_PROVIDER": "alpha_vantage"}, clear=True):
-            settings = GatewaySettings(_env_file=None)
-            with pytest.raises(ValueError, match="MARKET_DATA_ALPHA_VANTAGE_API_KEY is required"):
-                settings.validate_config()
+        settings = make_settings(provider="alpha_vantage")
+        with pytest.raises(ValueError, match=_RE_MISSING_KEY):
+            settings.validate_config()
 
     def test_validate_config_alpha_vantage_with_api_key(self):
         """Test that alpha_vantage provider works with API key."""
-        with patch.dict(
-            os.environ,
-            {
-                "MARKET_DATA_PROVIDER": "alpha_vantage",
-                "MARKET_DATA_ALPHA_VANTAGE_API_KEY": "valid_key_123",
-            },
-            clear=True,
-        ):
-            settings = GatewaySettings(_env_file=None)
-            # Should not raise
-            settings.validate_config()
+        settings = make_settings(provider="alpha_vantage", alpha_vantage_api_key="valid_key_123")
+        # Should not raise
+        settings.validate_config()
 
     def test_validate_config_alpha_vantage_placeholder_key_rejected(self):
         """Test that placeholder API key is rejected."""
-        with patch.dict(
-            os.environ,
-            {
-                "MARKET_DATA_PROVIDER": "alpha_vantage",
-                "MARKET_DATA_ALPHA_VANTAGE_API_KEY": "your_api_key_here",
-            },
-            clear=True,
-        ):
-            settings = GatewaySettings(_env_file=None)
-            with pytest.raises(ValueError, match="MARKET_DATA_ALPHA_VANTAGE_API_KEY is required"):
-                settings.validate_config()
-
-    def test_masked_alpha_vantage_key_not_set(self):
-        """Test masked key when no API key is set."""
-        with patch.dict(os.environ, {}, clear=True):
-            settings = GatewaySettings(_env_file=None)
-            assert settings.masked_alpha_vantage_key() == "N/A"
-
-    def test_masked_alpha_vantage_key_short_key(self):
-        """Test masked key with short API key."""
-        with patch.dict(
-            os.environ, {"MARKET_DATA_ALPHA_VANTAGE_API_KEY": "short"}, clear=True
-        ):
-            settings = GatewaySettings(_env_file=None)
-            assert settings.masked_alpha_vantage_key() == "***"
-
-    def test_masked_alpha_vantage_key_normal_key(self):
-        """Test masked key with normal length API key."""
-        with patch.dict(
-            os.environ,
-            {"MARKET_DATA_ALPHA_VANTAGE_API_KEY": "abcdefgh12345678"},
-            clear=True,
-        ):
-            settings = GatewaySettings(_env_file=None)
-            masked = settings.masked_alpha_vantage_key()
-            assert masked.startswith("abcd")
-            assert masked.endswith("5678")
-            assert "..." in masked
+        settings = make_settings(
+            provider="alpha_vantage", alpha_vantage_api_key="your_api_key_here"
+        )
+        with pytest.raises(ValueError, match=_RE_MISSING_KEY):
+            settings.validate_config()
+
+    @pytest.mark.parametrize(
+        "api_key,expected",
+        [(None, "N/A"), ("short", "***"), ("abcdefgh12345678", "abcd...5678")],
+        ids=["not_set", "short_key", "normal_key"],
+    )
+    def test_masked_alpha_vantage_key(self, api_key, expected):
+        """Test masked key formatting for missing, short and normal API keys."""
+        settings = make_settings(alpha_vantage_api_key=api_key)
+        assert settings.masked_alpha_vantage_key() == expected
 
 
 class TestApplicationConfig:
     """Test ApplicationConfig facade class."""
 
-    def test_initialization_with_yfinance_default(self):
+    def test_initialization_with_yfinance_default(self, default_config):
         """Test initialization with yfinance as default provider."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = ApplicationConfig(_env_file=None)
-            assert config.gateway.provider == "yfinance"
-            assert config.gateway.alpha_vantage_api_key is None
+        assert default_config.gateway.provider == "yfinance"
+        assert default_config.gateway.alpha_vantage_api_key is None
 
     def test_initialization_with_alpha_vantage(self):
         """Test initialization with alpha_vantage provider."""
-        with patch.dict(
-            os.environ,
-            {
-                "MARKET_DATA_PROVIDER": "alpha_vantage",
-                "MARKET_DATA_ALPHA_VANTAGE_API_KEY": "test_key_123",
-            },
-            clear=True,
-        ):
-            config = ApplicationConfig(_env_file=None)
-            assert config.gateway.provider == "alpha_vantage"
-            assert config.gateway.alpha_vantage_api_key == "test_key_123"
+        config = build_settings(
+            ApplicationConfig,
+            MARKET_DATA_PROVIDER="alpha_vantage",
+            MARKET_DATA_ALPHA_VANTAGE_API_KEY="test_key_123",
+        )
+        assert config.gateway.provider == "alpha_vantage"
+        assert config.gateway.alpha_vantage_api_key == "test_key_123"
 
     def test_initialization_validates_gateway_config(self):
         """Test that initialization validates gateway configuration."""
-        with patch.dict(os.environ, {"MARKET_DATA_PROVIDER": "alpha_vantage"}, clear=True):
-            with pytest.raises(ValueError, match="MARKET_DATA_ALPHA_VANTAGE_API_KEY is required"):
-                ApplicationConfig(_env_file=None)
+        with pytest.raises(ValueError, match=_RE_MISSING_KEY):
+            build_settings(ApplicationConfig, MARKET_DATA_PROVIDER="alpha_vantage")
 
-    def test_repr_includes_gateway_info(self):
+    def test_repr_includes_gateway_info(self, default_config):
         """Test that __repr__ includes gateway information."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = ApplicationConfig(_env_file=None)
-            repr_str = repr(config)
-            assert "gateway.provider=yfinance" in repr_str
+        repr_str = repr(default_config)
+        assert "gateway.provider=yfinance" in repr_str
 
-    def test_all_settings_initialized(self):
+    def test_all_settings_initialized(self, default_config):
         """Test that all settings groups are initialized."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = ApplicationConfig(_env_file=None)
-            assert config.gateway is not None
-            assert config.cache is not None
-            assert config.database is not None
-            assert config.logging is not None
-            assert config.rate_limit is not None
+        assert default_config.gateway is not None
+        assert default_config.cache is not None
+        assert default_config.database is not None
+        assert default_config.logging is not None
+        assert default_config.rate_limit is not None
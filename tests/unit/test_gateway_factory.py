@@ -4,58 +4,59 @@ Unit tests for GatewayFactory.
 Tests the factory pattern implementation for creating market data gateways.
 """
 
-import os
 import pytest
-from unittest.mock import patch, Mock
+from unittest.mock import MagicMock
 
 from stock_friend.gateways.base import IMarketDataGateway
 from stock_friend.infrastructure.gateway_factory import GatewayFactory
 from stock_friend.infrastructure.config import ApplicationConfig
 from stock_friend.infrastructure.cache_manager import CacheManager
 from stock_friend.infrastructure.rate_limiter import RateLimiter
+from tests.fixtures.settings_env import clear_settings_env, settings_env
 
 
-@pytest.fixture
-def mock_cache_manager(tmp_path):
-    """Create a mock cache manager for testing."""
-    cache_dir = tmp_path / "cache"
-    return CacheManager(cache_dir=str(cache_dir), size_limit_mb=10)
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    """Start each test without settings env vars; tests set only what they need."""
+    clear_settings_env(monkeypatch)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def mock_cache_manager():
+    """Create a spec'd cache manager mock (tests only check identity; no disk I/O)."""
+    return MagicMock(spec=CacheManager)
+
+
+@pytest.fixture(scope="module")
 def mock_rate_limiter():
-    """Create a mock rate limiter for testing."""
-    return RateLimiter()
+    """Create a spec'd rate limiter mock."""
+    return MagicMock(spec=RateLimiter)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config_yfinance():
     """Create config with yfinance as provider."""
-    with patch.dict(os.environ, {"MARKET_DATA_PROVIDER": "yfinance"}, clear=True):
+    with settings_env(MARKET_DATA_PROVIDER="yfinance"):
         return ApplicationConfig(_env_file=None)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config_alpha_vantage():
     """Create config with alpha_vantage as provider."""
-    with patch.dict(
-        os.environ,
-        {
-            "MARKET_DATA_PROVIDER": "alpha_vantage",
-            "MARKET_DATA_ALPHA_VANTAGE_API_KEY": "test_key_123",
-        },
-        clear=True,
+    with settings_env(
+        MARKET_DATA_PROVIDER="alpha_vantage",
+        MARKET_DATA_ALPHA_VANTAGE_API_KEY="test_key_123",
     ):
         return ApplicationConfig(_env_file=None)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def factory_yfinance(config_yfinance, mock_cache_manager, mock_rate_limiter):
     """Create GatewayFactory with yfinance config."""
     return GatewayFactory(config_yfinance, mock_cache_manager, mock_rate_limiter)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def factory_alpha_vantage(config_alpha_vantage, mock_cache_manager, mock_rate_limiter):
     """Create GatewayFactory with alpha_vantage config."""
     return GatewayFactory(config_alpha_vantage, mock_cache_manager, mock_rate_limiter)
@@ -136,17 +137,15 @@ class TestCreateYFinanceGateway:
         assert gateway.requests_per_hour == 2000
 
     def test_create_yfinance_gateway_custom_rate_limit(
-        self, mock_cache_manager, mock_rate_limiter
+        self, monkeypatch, mock_cache_manager, mock_rate_limiter
     ):
         """Test YFinance gateway with custom rate limit."""
-        with patch.dict(
-            os.environ, {"MARKET_DATA_YFINANCE_RATE_LIMIT": "5000"}, clear=True
-        ):
-            config = ApplicationConfig(_env_file=None)
-            factory = GatewayFactory(config, mock_cache_manager, mock_rate_limiter)
-            gateway = factory.create_gateway("yfinance")
+        monkeypatch.setenv("MARKET_DATA_YFINANCE_RATE_LIMIT", "5000")
+        config = ApplicationConfig(_env_file=None)
+        factory = GatewayFactory(config, mock_cache_manager, mock_rate_limiter)
+        gateway = factory.create_gateway("yfinance")
 
-            assert gateway.requests_per_hour == 5000
+        assert gateway.requests_per_hour == 5000
 
 
 class TestCreateAlphaVantageGateway:
@@ -161,15 +160,15 @@ class TestCreateAlphaVantageGateway:
         assert gateway.rate_limiter is factory_alpha_vantage.rate_limiter
 
     def test_create_alpha_vantage_gateway_without_api_key(
-        self, mock_cache_manager, mock_rate_limiter
+        self, monkeypatch, mock_cache_manager, mock_rate_limiter
     ):
         """Test Alpha Vantage gateway creation fails without API key."""
-        with patch.dict(os.environ, {"MARKET_DATA_PROVIDER": "yfinance"}, clear=True):
-            config = ApplicationConfig(_env_file=None)
-            factory = GatewayFactory(config, mock_cache_manager, mock_rate_limiter)
+        monkeypatch.setenv("MARKET_DATA_PROVIDER", "yfinance")
+        config = ApplicationConfig(_env_file=None)
+        factory = GatewayFactory(config, mock_cache_manager, mock_rate_limiter)
 
-            with pytest.raises(ValueError, match="Alpha Vantage API key is required"):
-                factory.create_gateway("alpha_vantage")
+        with pytest.raises(ValueError, match="Alpha Vantage API key is required"):
+            factory.create_gateway("alpha_vantage")
 
     def test_create_alpha_vantage_gateway_dependencies_injected(
         self, factory_alpha_vantage
@@ -184,51 +183,28 @@ class TestCreateAlphaVantageGateway:
 class TestGatewaySwitching:
     """Test switching between different gateway providers."""
 
-    def test_switch_from_yfinance_to_alpha_vantage(
-        self, mock_cache_manager, mock_rate_limiter
-    ):
-        """Test switching from yfinance to alpha_vantage."""
-        with patch.dict(
-            os.environ,
-            {
-                "MARKET_DATA_PROVIDER": "yfinance",
-                "MARKET_DATA_ALPHA_VANTAGE_API_KEY": "test_key_123",
-            },
-            clear=True,
+    @pytest.fixture(scope="class", params=["yfinance", "alpha_vantage"])
+    def switching_factory(self, request, mock_cache_manager, mock_rate_limiter):
+        """Create one factory per default provider, with an API key for both."""
+        with settings_env(
+            MARKET_DATA_PROVIDER=request.param,
+            MARKET_DATA_ALPHA_VANTAGE_API_KEY="test_key_123",
         ):
             config = ApplicationConfig(_env_file=None)
-            factory = GatewayFactory(config, mock_cache_manager, mock_rate_limiter)
+        return GatewayFactory(config, mock_cache_manager, mock_rate_limiter)
 
-            # Default is yfinance
-            gateway1 = factory.create_gateway()
-            assert gateway1.get_name() == "yfinance"
+    def test_switch_default_to_override(self, switching_factory):
+        """Test overriding the configured default provider in either direction."""
+        default_provider = switching_factory.config.gateway.provider
+        override = "alpha_vantage" if default_provider == "yfinance" else "yfinance"
 
-            # Override to alpha_vantage
-            gateway2 = factory.create_gateway("alpha_vantage")
-            assert gateway2.get_name() == "alpha_vantage"
+        # Default comes from config
+        gateway1 = switching_factory.create_gateway()
+        assert gateway1.get_name() == default_provider
 
-    def test_switch_from_alpha_vantage_to_yfinance(
-        self, mock_cache_manager, mock_rate_limiter
-    ):
-        """Test switching from alpha_vantage to yfinance."""
-        with patch.dict(
-            os.environ,
-            {
-                "MARKET_DATA_PROVIDER": "alpha_vantage",
-                "MARKET_DATA_ALPHA_VANTAGE_API_KEY": "test_key_123",
-            },
-            clear=True,
-        ):
-            config = ApplicationConfig(_env_file=None)
-            factory = GatewayFactory(config, mock_cache_manager, mock_rate_limiter)
-
-            # Default is alpha_vantage
-            gateway1 = factory.create_gateway()
-            assert gateway1.get_name() == "alpha_vantage"
-
-            # Override to yfinance
-            gateway2 = factory.create_gateway("yfinance")
-            assert gateway2.get_name() == "yfinance"
+        # Explicit provider overrides it
+        gateway2 = switching_factory.create_gateway(override)
+        assert gateway2.get_name() == override
 
 
 class TestGatewayFactoryEdgeCases:
@@ -243,18 +219,10 @@ class TestGatewayFactoryEdgeCases:
         gateway = factory_yfinance.create_gateway(None)
         assert gateway.get_name() == "yfinance"
 
-    def test_multiple_gateway_instances_independent(self, factory_yfinance):
-        """Test that multiple gateway instances are independent."""
-        gateway1 = factory_yfinance.create_gateway("yfinance")
-        gateway2 = factory_yfinance.create_gateway("yfinance")
+    def test_factory_creates_independent_instances(self, factory_yfinance):
+        """Test that a reused factory builds a fresh, correctly named gateway each call."""
+        gateways = [factory_yfinance.create_gateway() for _ in range(3)]
 
         # Should be different instances
-        assert gateway1 is not gateway2
-
-    def test_factory_reusable_for_multiple_creations(self, factory_yfinance):
-        """Test that factory can be reused for multiple gateway creations."""
-        gateway1 = factory_yfinance.create_gateway()
-        gateway2 = factory_yfinance.create_gateway()
-        gateway3 = factory_yfinance.create_gateway()
-
-        assert all(g.get_name() == "yfinance" for g in [gateway1, gateway2, gateway3])
+        assert len({id(g) for g in gateways}) == len(gateways)
+        assert all(g.get_name() == "yfinance" for g in gateways)
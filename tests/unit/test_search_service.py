@@ -8,41 +8,65 @@ from decimal import Decimal
 from unittest.mock import Mock
 import pytest
 
-from stock_friend.gateways.base import DataProviderException
-from stock_friend.infrastructure.cache_manager import CacheManager
+from stock_friend.gateways.base import DataProviderException, IMarketDataGateway
 from stock_friend.models.search_models import SearchResult
 from stock_friend.models.stock_data import FundamentalData
 from stock_friend.services.search_service import SearchService
+from tests.fixtures.in_memory_cache import InMemoryCache
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_gateway():
-    """Create a mock market data gateway."""
-    return Mock()
+    """Create a mock market data gateway restricted to the gateway interface."""
+    return Mock(spec=IMarketDataGateway)
 
 
-@pytest.fixture
-def mock_cache_manager(tmp_path):
-    """Create a mock cache manager."""
-    cache_dir = tmp_path / "cache"
-    return CacheManager(cache_dir=str(cache_dir), size_limit_mb=10)
+@pytest.fixture(scope="module")
+def mock_cache_manager():
+    """Create an in-memory cache manager fake."""
+    return InMemoryCache()
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_shared_dependencies(mock_gateway, mock_cache_manager):
+    """Give each test a fresh gateway mock and an empty cache."""
+    mock_gateway.reset_mock(return_value=True, side_effect=True)
+    mock_cache_manager.clear()
+
+
+@pytest.fixture(scope="module")
 def service(mock_gateway, mock_cache_manager):
     """Create SearchService with mocked dependencies."""
     return SearchService(gateway=mock_gateway, cache_manager=mock_cache_manager)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def service_without_cache(mock_gateway):
     """Create SearchService without cache manager."""
     return SearchService(gateway=mock_gateway)
 
 
+@pytest.fixture(scope="module")
+def aapl_search_result():
+    """Create a single US search result for AAPL (frozen, safe to share)."""
+    return SearchResult(
+        ticker="AAPL",
+        company_name="Apple Inc.",
+        exchange="US Market",
+        sector="Technology",
+        quote_type="EQUITY",
+    )
+
+
 @pytest.fixture
+def aapl_search_results(aapl_search_result):
+    """Wrap the shared AAPL result in a fresh list for the gateway mock to return."""
+    return [aapl_search_result]
+
+
+@pytest.fixture(scope="module")
 def sample_fundamental():
-    """Create sample fundamental data."""
+    """Create sample fundamental data once (frozen, safe to share)."""
     return FundamentalData(
         ticker="AAPL",
         company_name="Apple Inc.",
@@ -72,19 +96,11 @@ class TestSearch:
     """Test search method."""
 
     def test_search_single_result_us_ticker(
-        self, service, mock_gateway, sample_fundamental
+        self, service, mock_gateway, aapl_search_results
     ):
         """Test search with single US ticker result."""
         # Mock gateway search_stock to return search results
-        mock_gateway.search_stock.return_value = [
-            SearchResult(
-                ticker="AAPL",
-                company_name="Apple Inc.",
-                exchange="US Market",
-                sector="Technology",
-                quote_type="EQUITY",
-            )
-        ]
+        mock_gateway.search_stock.return_value = aapl_search_results
 
         results = service.search("AAPL")
 
@@ -166,18 +182,12 @@ class TestSearch:
 
         assert len(results) == 0
 
-    def test_search_skips_invalid_fundamental_data(self, service, mock_gateway):
+    def test_search_skips_invalid_fundamental_data(
+        self, service, mock_gateway, aapl_search_results
+    ):
         """Test that gateway handles filtering of invalid results."""
         # Gateway should only return valid results with company names
-        mock_gateway.search_stock.return_value = [
-            SearchResult(
-                ticker="AAPL",
-                company_name="Apple Inc.",
-                exchange="US Market",
-                sector="Technology",
-                quote_type="EQUITY",
-            )
-        ]
+        mock_gateway.search_stock.return_value = aapl_search_results
 
         results = service.search("AAPL")
 
@@ -200,17 +210,9 @@ class TestSearch:
         tickers = [r.ticker for r in results]
         assert len(tickers) == len(set(tickers))  # No duplicates
 
-    def test_search_caching(self, service, mock_gateway, sample_fundamental):
+    def test_search_caching(self, service, mock_gateway, aapl_search_results):
         """Test that search results are cached."""
-        mock_gateway.search_stock.return_value = [
-            SearchResult(
-                ticker="AAPL",
-                company_name="Apple Inc.",
-                exchange="US Market",
-                sector="Technology",
-                quote_type="EQUITY",
-            )
-        ]
+        mock_gateway.search_stock.return_value = aapl_search_results
 
         # First call
         results1 = service.search("AAPL")
@@ -225,17 +227,9 @@ class TestSearch:
         # Second call should not make additional API calls
         assert call_count_2 == call_count_1
 
-    def test_search_case_normalization(self, service, mock_gateway, sample_fundamental):
+    def test_search_case_normalization(self, service, mock_gateway, aapl_search_results):
         """Test that ticker queries are normalized to uppercase."""
-        mock_gateway.search_stock.return_value = [
-            SearchResult(
-                ticker="AAPL",
-                company_name="Apple Inc.",
-                exchange="US Market",
-                sector="Technology",
-                quote_type="EQUITY",
-            )
-        ]
+        mock_gateway.search_stock.return_value = aapl_search_results
 
         results = service.search("aapl")
 
@@ -296,46 +290,32 @@ class TestGetDetailedInfo:
 class TestExchangeMapping:
     """Test exchange suffix mapping."""
 
-    def test_extract_exchange_us_ticker(self, service, mock_gateway, sample_fundamental):
-        """Test exchange extraction for US ticker."""
-        exchange = service._extract_exchange("AAPL", sample_fundamental)
-        assert exchange == "US Market"
-
-    def test_extract_exchange_london(self, service, mock_gateway, sample_fundamental):
-        """Test exchange extraction for London ticker."""
-        exchange = service._extract_exchange("BARC.L", sample_fundamental)
-        assert exchange == "LSE"
-
-    def test_extract_exchange_toronto(self, service, mock_gateway, sample_fundamental):
-        """Test exchange extraction for Toronto ticker."""
-        exchange = service._extract_exchange("RY.TO", sample_fundamental)
-        assert exchange == "TSX"
-
-    def test_extract_exchange_unknown_suffix(
-        self, service, mock_gateway, sample_fundamental
-    ):
-        """Test exchange extraction for unknown suffix."""
-        exchange = service._extract_exchange("TEST.XYZ", sample_fundamental)
-        assert "XYZ" in exchange
+    @pytest.mark.parametrize(
+        "ticker,expected",
+        [
+            ("AAPL", "US Market"),
+            ("BARC.L", "LSE"),
+            ("RY.TO", "TSX"),
+            ("TEST.XYZ", "XYZ Exchange"),
+        ],
+        ids=["us_ticker", "london", "toronto", "unknown_suffix"],
+    )
+    def test_extract_exchange(self, service, sample_fundamental, ticker, expected):
+        """Test exchange extraction from ticker suffix (unknown suffixes fall back)."""
+        assert service._extract_exchange(ticker, sample_fundamental) == expected
 
 
 class TestTickerFormatting:
     """Test ticker formatting logic."""
 
-    def test_format_ticker_with_exchange_hint(self, service):
-        """Test formatting ticker with exchange hint."""
-        ticker = service._format_ticker("BARC", "L")
-        assert ticker == "BARC.L"
-
-    def test_format_ticker_with_dot_in_hint(self, service):
-        """Test that leading dot in hint is stripped."""
-        ticker = service._format_ticker("BARC", ".L")
-        assert ticker == "BARC.L"
-
-    def test_format_ticker_already_has_suffix(self, service):
-        """Test that ticker with existing suffix is returned as-is."""
-        ticker = service._format_ticker("BARC.L", "L")
-        assert ticker == "BARC.L"
+    @pytest.mark.parametrize(
+        "query,exchange_hint",
+        [("BARC", "L"), ("BARC", ".L"), ("BARC.L", "L")],
+        ids=["with_exchange_hint", "dot_in_hint", "already_has_suffix"],
+    )
+    def test_format_ticker(self, service, query, exchange_hint):
+        """Test suffix is appended once, with any leading dot in the hint stripped."""
+        assert service._format_ticker(query, exchange_hint) == "BARC.L"
 
 
 class TestEdgeCases:
@@ -349,17 +329,9 @@ class TestEdgeCases:
         # Should search for empty string, which won't match anything
         assert len(results) == 0
 
-    def test_search_with_whitespace(self, service, mock_gateway, sample_fundamental):
+    def test_search_with_whitespace(self, service, mock_gateway, aapl_search_results):
         """Test that whitespace is stripped from query."""
-        mock_gateway.search_stock.return_value = [
-            SearchResult(
-                ticker="AAPL",
-                company_name="Apple Inc.",
-                exchange="US Market",
-                sector="Technology",
-                quote_type="EQUITY",
-            )
-        ]
+        mock_gateway.search_stock.return_value = aapl_search_results
 
         results = service.search("  AAPL  ")
 
@@ -369,17 +341,11 @@ class TestEdgeCases:
         call_args = mock_gateway.search_stock.call_args
         assert call_args[1]["query"] == "AAPL"
 
-    def test_service_without_cache_works(self, service_without_cache, mock_gateway, sample_fundamental):
+    def test_service_without_cache_works(
+        self, service_without_cache, mock_gateway, aapl_search_results
+    ):
         """Test that service works without cache manager."""
-        mock_gateway.search_stock.return_value = [
-            SearchResult(
-                ticker="AAPL",
-                company_name="Apple Inc.",
-                exchange="US Market",
-                sector="Technology",
-                quote_type="EQUITY",
-            )
-        ]
+        mock_gateway.search_stock.return_value = aapl_search_results
 
         results = service_without_cache.search("AAPL")
 
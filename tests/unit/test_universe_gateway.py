@@ -4,6 +4,8 @@ Unit tests for Universe Gateway.
 Tests the StaticUniverseGateway with mocked CSV files.
 """
 
+import shutil
+
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
@@ -12,38 +14,52 @@ from stock_friend.gateways.universe_gateway import StaticUniverseGateway
 from stock_friend.models.stock_data import StockInfo
 
 
-@pytest.fixture
-def mock_data_dir(tmp_path):
-    """Create temporary directory with mock CSV files."""
-    data_dir = tmp_path / "universes"
-    data_dir.mkdir()
-
-    # Create sp500 CSV
-    sp500_csv = data_dir / "sp500_constituents.csv"
-    sp500_csv.write_text(
-        "ticker,company_name,sector,industry\n"
-        "AAPL,Apple Inc.,Technology,Consumer Electronics\n"
-        "MSFT,Microsoft Corporation,Technology,Software\n"
-        "GOOGL,Alphabet Inc.,Technology,Internet Services\n"
-    )
-
-    # Create nasdaq100 CSV
-    nasdaq_csv = data_dir / "nasdaq100_constituents.csv"
-    nasdaq_csv.write_text(
-        "ticker,company_name,sector,industry\n"
-        "TSLA,Tesla Inc.,Automotive,Electric Vehicles\n"
-        "NVDA,NVIDIA Corporation,Technology,Semiconductors\n"
-    )
+_SP500_CSV = (
+    b"ticker,company_name,sector,industry\n"
+    b"AAPL,Apple Inc.,Technology,Consumer Electronics\n"
+    b"MSFT,Microsoft Corporation,Technology,Software\n"
+    b"GOOGL,Alphabet Inc.,Technology,Internet Services\n"
+)
+
+_NASDAQ100_CSV = (
+    b"ticker,company_name,sector,industry\n"
+    b"TSLA,Tesla Inc.,Automotive,Electric Vehicles\n"
+    b"NVDA,NVIDIA Corporation,Technology,Semiconductors\n"
+)
+
+
+@pytest.fixture(scope="module")
+def mock_data_dir(tmp_path_factory):
+    """Create temporary directory with mock CSV files (shared; do not write to it)."""
+    data_dir = tmp_path_factory.mktemp("universes")
+
+    # Pre-encoded payloads skip the text-mode encoding layer
+    (data_dir / "sp500_constituents.csv").write_bytes(_SP500_CSV)
+    (data_dir / "nasdaq100_constituents.csv").write_bytes(_NASDAQ100_CSV)
 
     return data_dir
 
 
 @pytest.fixture
+def writable_data_dir(mock_data_dir, tmp_path):
+    """Copy the mock CSV files into a per-test directory that tests may add files to."""
+    data_dir = tmp_path / "universes"
+    shutil.copytree(mock_data_dir, data_dir)
+    return data_dir
+
+
+@pytest.fixture(scope="module")
 def gateway(mock_data_dir):
     """Create gateway with mock data directory."""
     return StaticUniverseGateway(data_dir=mock_data_dir)
 
 
+@pytest.fixture(scope="module")
+def sp500_stocks(gateway):
+    """Parse the mock S&P 500 CSV once for the module."""
+    return gateway.get_universe("sp500")
+
+
 class TestStaticUniverseGatewayInit:
     """Test gateway initialization."""
 
@@ -81,12 +97,12 @@ class TestListUniverses:
         universes = gateway.list_universes()
         assert universes == sorted(universes)
 
-    def test_list_universes_excludes_non_constituent_files(self, mock_data_dir):
+    def test_list_universes_excludes_non_constituent_files(self, writable_data_dir):
         """Should only include files with _constituents.csv suffix."""
         # Create non-constituent file
-        (mock_data_dir / "other_file.csv").write_text("data")
+        (writable_data_dir / "other_file.csv").write_text("data")
 
-        gateway = StaticUniverseGateway(data_dir=mock_data_dir)
+        gateway = StaticUniverseGateway(data_dir=writable_data_dir)
         universes = gateway.list_universes()
 
         assert "other_file" not in universes
@@ -106,18 +122,16 @@ class TestListUniverses:
 class TestGetUniverse:
     """Test loading universe data."""
 
-    def test_get_universe_loads_sp500_successfully(self, gateway):
+    def test_get_universe_loads_sp500_successfully(self, sp500_stocks):
         """Should load S&P 500 constituents from CSV."""
-        stocks = gateway.get_universe("sp500")
-
-        assert len(stocks) == 3
-        assert all(isinstance(stock, StockInfo) for stock in stocks)
+        assert len(sp500_stocks) == 3
+        assert all(isinstance(stock, StockInfo) for stock in sp500_stocks)
 
         # Check first stock
-        assert stocks[0].ticker == "AAPL"
-        assert stocks[0].name == "Apple Inc."
-        assert stocks[0].sector == "Technology"
-        assert stocks[0].industry == "Consumer Electronics"
+        assert sp500_stocks[0].ticker == "AAPL"
+        assert sp500_stocks[0].name == "Apple Inc."
+        assert sp500_stocks[0].sector == "Technology"
+        assert sp500_stocks[0].industry == "Consumer Electronics"
 
     def test_get_universe_loads_nasdaq100_successfully(self, gateway):
         """Should load NASDAQ-100 constituents from CSV."""
@@ -127,18 +141,17 @@ class TestGetUniverse:
         assert stocks[0].ticker == "TSLA"
         assert stocks[1].ticker == "NVDA"
 
-    def test_get_universe_is_case_insensitive(self, gateway):
+    def test_get_universe_is_case_insensitive(self, gateway, sp500_stocks):
         """Should handle case-insensitive universe names."""
-        stocks_lower = gateway.get_universe("sp500")
         stocks_upper = gateway.get_universe("SP500")
         stocks_mixed = gateway.get_universe("Sp500")
 
-        assert len(stocks_lower) == len(stocks_upper) == len(stocks_mixed) == 3
+        assert stocks_upper == stocks_mixed == sp500_stocks
 
-    def test_get_universe_strips_whitespace_from_name(self, gateway):
+    def test_get_universe_strips_whitespace_from_name(self, gateway, sp500_stocks):
         """Should strip whitespace from universe name."""
         stocks = gateway.get_universe("  sp500  ")
-        assert len(stocks) == 3
+        assert stocks == sp500_stocks
 
     def test_get_universe_raises_error_for_empty_name(self, gateway):
         """Should raise ValueError for empty universe name."""
@@ -158,38 +171,38 @@ class TestGetUniverse:
         with pytest.raises(FileNotFoundError, match="Available universes: nasdaq100, sp500"):
             gateway.get_universe("missing")
 
-    def test_get_universe_handles_missing_sector_gracefully(self, mock_data_dir):
+    def test_get_universe_handles_missing_sector_gracefully(self, writable_data_dir):
         """Should default to 'Unknown' for missing sector/industry."""
-        csv_file = mock_data_dir / "test_constituents.csv"
+        csv_file = writable_data_dir / "test_constituents.csv"
         csv_file.write_text(
             "ticker,company_name,sector,industry\n"
             "TEST,Test Corp,,\n"  # Empty sector and industry
         )
 
-        gateway = StaticUniverseGateway(data_dir=mock_data_dir)
+        gateway = StaticUniverseGateway(data_dir=writable_data_dir)
         stocks = gateway.get_universe("test")
 
         assert stocks[0].sector == "Unknown"
         assert stocks[0].industry == "Unknown"
 
-    def test_get_universe_skips_rows_with_empty_ticker(self, mock_data_dir):
+    def test_get_universe_skips_rows_with_empty_ticker(self, writable_data_dir):
         """Should skip rows with empty ticker."""
-        csv_file = mock_data_dir / "test_constituents.csv"
+        csv_file = writable_data_dir / "test_constituents.csv"
         csv_file.write_text(
             "ticker,company_name,sector,industry\n"
             ",Empty Ticker Corp,Tech,Software\n"
             "VALID,Valid Corp,Tech,Software\n"
         )
 
-        gateway = StaticUniverseGateway(data_dir=mock_data_dir)
+        gateway = StaticUniverseGateway(data_dir=writable_data_dir)
         stocks = gateway.get_universe("test")
 
         assert len(stocks) == 1
         assert stocks[0].ticker == "VALID"
 
-    def test_get_universe_handles_malformed_rows_gracefully(self, mock_data_dir, capfd):
+    def test_get_universe_handles_malformed_rows_gracefully(self, writable_data_dir, capfd):
         """Should continue processing when encountering malformed rows."""
-        csv_file = mock_data_dir / "test_constituents.csv"
+        csv_file = writable_data_dir / "test_constituents.csv"
         csv_file.write_text(
             "ticker,company_name,sector,industry\n"
             "GOOD1,Good Corp,Tech,Software\n"
@@ -197,7 +210,7 @@ class TestGetUniverse:
             "GOOD2,Another Good Corp,Finance,Banking\n"
         )
 
-        gateway = StaticUniverseGateway(data_dir=mock_data_dir)
+        gateway = StaticUniverseGateway(data_dir=writable_data_dir)
         stocks = gateway.get_universe("test")
 
         # Should get the two valid rows
@@ -210,35 +223,35 @@ class TestGetUniverse:
         assert "Warning" in captured.out
         assert "row 3" in captured.out
 
-    def test_get_universe_raises_error_for_missing_columns(self, mock_data_dir):
+    def test_get_universe_raises_error_for_missing_columns(self, writable_data_dir):
         """Should raise ValueError if CSV is missing required columns."""
-        csv_file = mock_data_dir / "bad_constituents.csv"
+        csv_file = writable_data_dir / "bad_constituents.csv"
         csv_file.write_text(
             "ticker,name\n"  # Missing company_name, sector, industry
             "AAPL,Apple\n"
         )
 
-        gateway = StaticUniverseGateway(data_dir=mock_data_dir)
+        gateway = StaticUniverseGateway(data_dir=writable_data_dir)
 
         with pytest.raises(ValueError, match="CSV file missing required columns"):
             gateway.get_universe("bad")
 
-    def test_get_universe_raises_error_for_empty_csv(self, mock_data_dir):
+    def test_get_universe_raises_error_for_empty_csv(self, writable_data_dir):
         """Should raise ValueError if CSV contains no valid stocks."""
-        csv_file = mock_data_dir / "empty_constituents.csv"
+        csv_file = writable_data_dir / "empty_constituents.csv"
         csv_file.write_text(
             "ticker,company_name,sector,industry\n"
             # No data rows
         )
 
-        gateway = StaticUniverseGateway(data_dir=mock_data_dir)
+        gateway = StaticUniverseGateway(data_dir=writable_data_dir)
 
         with pytest.raises(ValueError, match="No valid stocks found"):
             gateway.get_universe("empty")
 
-    def test_get_universe_handles_unicode_company_names(self, mock_data_dir):
+    def test_get_universe_handles_unicode_company_names(self, writable_data_dir):
         """Should correctly handle Unicode characters in company names."""
-        csv_file = mock_data_dir / "international_constituents.csv"
+        csv_file = writable_data_dir / "international_constituents.csv"
         csv_file.write_text(
             "ticker,company_name,sector,industry\n"
             "ACME,ACME Société Européenne,Consumer Goods,Retail\n"
@@ -246,7 +259,7 @@ class TestGetUniverse:
             encoding="utf-8"
         )
 
-        gateway = StaticUniverseGateway(data_dir=mock_data_dir)
+        gateway = StaticUniverseGateway(data_dir=writable_data_dir)
         stocks = gateway.get_universe("international")
 
         assert len(stocks) == 2
@@ -6,22 +6,63 @@ Tests the YFinance gateway implementation with mocked yfinance library responses
 
 from datetime import datetime, timedelta
 from decimal import Decimal
-from unittest.mock import Mock, MagicMock, patch
+from types import SimpleNamespace
+from typing import Dict, Tuple
+from unittest.mock import Mock, MagicMock
 import pandas as pd
 import pytest
 
+from stock_friend.gateways import yfinance_gateway as ygw
 from stock_friend.gateways.yfinance_gateway import YFinanceGateway
 from stock_friend.gateways.base import DataProviderException, InsufficientDataError
-from stock_friend.infrastructure.cache_manager import CacheManager
+from stock_friend.infrastructure import rate_limiter as rate_limiter_module
 from stock_friend.infrastructure.rate_limiter import RateLimiter
 from stock_friend.models.stock_data import StockData
+from tests.fixtures.in_memory_cache import InMemoryCache
+
+
+# Decimal constants parsed once; mock info dicts use their float/int values
+PRICE_150_50 = Decimal("150.50")
+PRICE_151_75 = Decimal("151.75")
+PRICE_149_25 = Decimal("149.25")
+PRICE_250_75 = Decimal("250.75")
+MARKET_CAP_3T = Decimal("3000000000000")
+
+# Per-symbol Ticker.info for batch price tests; unknown symbols get empty info
+_BATCH_PRICE_INFO = {
+    "AAPL": {"currentPrice": float(PRICE_150_50)},
+    "MSFT": {"currentPrice": float(PRICE_250_75)},
+}
+
+
+class _FakeClock:
+    """Stand-in for the time module: monotonic() reads t, sleep() advances it."""
+
+    def __init__(self):
+        self.t = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.t
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.t += seconds
+
+
+@pytest.fixture(autouse=True)
+def fake_clock(monkeypatch):
+    """Run retry backoff and rate limiting on a fake clock so tests never really sleep."""
+    clock = _FakeClock()
+    monkeypatch.setattr(ygw, "time", clock)
+    monkeypatch.setattr(rate_limiter_module, "time", clock)
+    return clock
 
 
 @pytest.fixture
-def mock_cache_manager(tmp_path):
-    """Create a mock cache manager for testing."""
-    cache_dir = tmp_path / "cache"
-    return CacheManager(cache_dir=str(cache_dir), size_limit_mb=10)
+def mock_cache_manager():
+    """Create an in-memory cache manager fake for testing."""
+    return InMemoryCache()
 
 
 @pytest.fixture
@@ -46,21 +87,99 @@ def gateway_without_infra():
     return YFinanceGateway()
 
 
-@pytest.fixture
-def sample_ohlcv_df():
-    """Create sample OHLCV DataFrame."""
-    dates = pd.date_range(start="2025-01-01", periods=5, freq="D")
-    df = pd.DataFrame(
-        {
-            "Date": dates,
-            "Open": [100.0, 101.0, 102.0, 103.0, 104.0],
-            "High": [105.0, 106.0, 107.0, 108.0, 109.0],
-            "Low": [95.0, 96.0, 97.0, 98.0, 99.0],
-            "Close": [102.0, 103.0, 104.0, 105.0, 106.0],
-            "Volume": [1000000, 1100000, 1200000, 1300000, 1400000],
-        }
+_DAILY_DATES = pd.date_range(start="2025-01-01", periods=3, freq="D")
+
+
+def _multi_ticker_frame(base_prices: Dict[str, Tuple[float, int]]) -> pd.DataFrame:
+    """
+    Build a 3-day yf.download result grouped by ticker.
+
+    Columns are (ticker, field) tuples laid out directly, rather than
+    concatenating one frame per ticker.
+    """
+    steps = pd.RangeIndex(3)
+    columns = {}
+    for ticker, (price, volume) in base_prices.items():
+        columns[(ticker, "Date")] = _DAILY_DATES
+        columns[(ticker, "Open")] = price + steps
+        columns[(ticker, "High")] = price + 5 + steps
+        columns[(ticker, "Low")] = price - 5 + steps
+        columns[(ticker, "Close")] = price + 2 + steps
+        columns[(ticker, "Volume")] = volume + steps * 100000
+    return pd.DataFrame(columns)
+
+
+def _shared_frame(df: pd.DataFrame):
+    """Yield a module-shared frame and fail at teardown if any test mutated it."""
+    snapshot = df.copy()
+    yield df
+    pd.testing.assert_frame_equal(df, snapshot)
+
+
+@pytest.fixture(scope="module")
+def multi_ticker_df():
+    """Build a multi-ticker download result (grouped by ticker) once."""
+    yield from _shared_frame(
+        _multi_ticker_frame({"AAPL": (100, 1000000), "MSFT": (200, 2000000)})
     )
-    return df
+
+
+@pytest.fixture(scope="module")
+def partial_multi_df():
+    """Build a download result where INVALID returned no data (no columns) once."""
+    yield from _shared_frame(_multi_ticker_frame({"AAPL": (100, 1000000)}))
+
+
+@pytest.fixture(scope="module")
+def _patched_ticker():
+    """Patch yf.Ticker in the gateway module once for all tests here."""
+    ticker_cls = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(ygw.yf, "Ticker", ticker_cls)
+        yield ticker_cls
+
+
+def _download_serving(frames: Dict[Tuple[str, ...], pd.DataFrame]):
+    """
+    Build a yf.download side effect that returns a prebuilt frame per ticker list.
+
+    Requesting a ticker list with no prebuilt frame raises KeyError, so tests
+    also check which tickers the gateway asked for.
+    """
+
+    def _download(tickers, **kwargs):
+        return frames[tuple(tickers)]
+
+    return _download
+
+
+@pytest.fixture
+def mock_download(monkeypatch):
+    """Replace yf.download in the gateway module with a mock."""
+    download = MagicMock()
+    monkeypatch.setattr(ygw.yf, "download", download)
+    return download
+
+
+@pytest.fixture
+def mock_ticker_class(_patched_ticker):
+    """Provide the shared yf.Ticker mock with calls and configuration cleared."""
+    _patched_ticker.reset_mock(return_value=True, side_effect=True)
+    return _patched_ticker
+
+
+@pytest.fixture(scope="module")
+def ticker_factory():
+    """Return a builder for mock yf.Ticker instances with the given info/history."""
+
+    def _make(info=None, history=None):
+        # The gateway only reads .info and calls .history(), so a namespace
+        # with a Mock for history (to keep call assertions) is enough
+        return SimpleNamespace(
+            info=info if info is not None else {}, history=Mock(return_value=history)
+        )
+
+    return _make
 
 
 class TestYFinanceGatewayInitialization:
@@ -92,13 +211,12 @@ class TestYFinanceGatewayInitialization:
 class TestGetStockData:
     """Test get_stock_data method."""
 
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
-    def test_get_stock_data_success(self, mock_ticker_class, gateway, sample_ohlcv_df):
+    def test_get_stock_data_success(
+        self, mock_ticker_class, ticker_factory, gateway, sample_ohlcv_df
+    ):
         """Test successful stock data retrieval."""
         # Mock yfinance Ticker
-        mock_ticker = Mock()
-        mock_ticker.history.return_value = sample_ohlcv_df
-        mock_ticker_class.return_value = mock_ticker
+        mock_ticker_class.return_value = ticker_factory(history=sample_ohlcv_df)
 
         result = gateway.get_stock_data("AAPL", period="1mo")
 
@@ -109,21 +227,19 @@ class TestGetStockData:
         assert "date" in result.data.columns
         assert "open" in result.data.columns
 
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
-    def test_get_stock_data_empty_dataframe(self, mock_ticker_class, gateway):
+    def test_get_stock_data_empty_dataframe(self, mock_ticker_class, ticker_factory, gateway):
         """Test handling of empty DataFrame."""
-        mock_ticker = Mock()
-        mock_ticker.history.return_value = pd.DataFrame()
-        mock_ticker_class.return_value = mock_ticker
+        mock_ticker_class.return_value = ticker_factory(history=pd.DataFrame())
 
-        with pytest.raises(InsufficientDataError, match="No data returned"):
+        with pytest.raises(InsufficientDataError) as exc_info:
             gateway.get_stock_data("INVALID", period="1mo")
+        assert "No data returned" in str(exc_info.value)
 
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
-    def test_get_stock_data_with_dates(self, mock_ticker_class, gateway, sample_ohlcv_df):
+    def test_get_stock_data_with_dates(
+        self, mock_ticker_class, ticker_factory, gateway, sample_ohlcv_df
+    ):
         """Test stock data retrieval with start and end dates."""
-        mock_ticker = Mock()
-        mock_ticker.history.return_value = sample_ohlcv_df
+        mock_ticker = ticker_factory(history=sample_ohlcv_df)
         mock_ticker_class.return_value = mock_ticker
 
         start = datetime(2025, 1, 1)
@@ -133,50 +249,34 @@ class TestGetStockData:
         assert isinstance(result, StockData)
         mock_ticker.history.assert_called_once_with(start=start, end=end)
 
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
-    def test_get_stock_data_caching(self, mock_ticker_class, gateway, sample_ohlcv_df):
-        """Test that stock data is cached."""
-        mock_ticker = Mock()
-        mock_ticker.history.return_value = sample_ohlcv_df
-        mock_ticker_class.return_value = mock_ticker
-
-        # First call - should hit API
-        result1 = gateway.get_stock_data("AAPL", period="1mo")
-        assert mock_ticker.history.call_count == 1
-
-        # Second call - should hit cache
-        result2 = gateway.get_stock_data("AAPL", period="1mo")
-        assert mock_ticker.history.call_count == 1  # No additional API call
-        assert result1.ticker == result2.ticker
-
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
-    def test_get_stock_data_ticker_normalization(self, mock_ticker_class, gateway, sample_ohlcv_df):
+    def test_get_stock_data_ticker_normalization(
+        self, mock_ticker_class, ticker_factory, gateway, sample_ohlcv_df
+    ):
         """Test that ticker is normalized to uppercase."""
-        mock_ticker = Mock()
-        mock_ticker.history.return_value = sample_ohlcv_df
-        mock_ticker_class.return_value = mock_ticker
+        mock_ticker_class.return_value = ticker_factory(history=sample_ohlcv_df)
 
         result = gateway.get_stock_data("aapl", period="1mo")
         assert result.ticker == "AAPL"
 
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
-    def test_get_stock_data_error_handling(self, mock_ticker_class, gateway):
+    def test_get_stock_data_error_handling(self, mock_ticker_class, gateway, fake_clock):
         """Test error handling when API fails."""
         mock_ticker = Mock()
         mock_ticker.history.side_effect = Exception("Network error")
         mock_ticker_class.return_value = mock_ticker
 
-        with pytest.raises(DataProviderException, match="YFinance error"):
+        with pytest.raises(DataProviderException) as exc_info:
             gateway.get_stock_data("AAPL", period="1mo")
+        assert "YFinance error" in str(exc_info.value)
+        # Retried with exponential backoff between the three attempts
+        assert fake_clock.sleeps == [2.0, 4.0]
 
 
 class TestGetBatchStockData:
     """Test get_batch_stock_data method."""
 
-    @patch("stock_friend.gateways.yfinance_gateway.yf.download")
     def test_get_batch_stock_data_single_ticker(self, mock_download, gateway, sample_ohlcv_df):
         """Test batch retrieval with single ticker."""
-        mock_download.return_value = sample_ohlcv_df
+        mock_download.side_effect = _download_serving({("AAPL",): sample_ohlcv_df})
 
         result = gateway.get_batch_stock_data(["AAPL"], period="1mo")
 
@@ -184,177 +284,86 @@ class TestGetBatchStockData:
         assert "AAPL" in result
         assert isinstance(result["AAPL"], StockData)
 
-    @patch("stock_friend.gateways.yfinance_gateway.yf.download")
-    def test_get_batch_stock_data_multiple_tickers(self, mock_download, gateway):
-        """Test batch retrieval with multiple tickers."""
-        # Create mock multi-ticker DataFrame
-        dates = pd.date_range(start="2025-01-01", periods=3, freq="D")
-        aapl_data = pd.DataFrame(
-            {
-                "Date": dates,
-                "Open": [100, 101, 102],
-                "High": [105, 106, 107],
-                "Low": [95, 96, 97],
-                "Close": [102, 103, 104],
-                "Volume": [1000000, 1100000, 1200000],
-            }
-        )
-        msft_data = pd.DataFrame(
-            {
-                "Date": dates,
-                "Open": [200, 201, 202],
-                "High": [205, 206, 207],
-                "Low": [195, 196, 197],
-                "Close": [202, 203, 204],
-                "Volume": [2000000, 2100000, 2200000],
-            }
-        )
-
-        # Mock multi-ticker DataFrame (grouped by ticker)
-        multi_df = pd.concat({"AAPL": aapl_data, "MSFT": msft_data}, axis=1)
-        mock_download.return_value = multi_df
-
-        result = gateway.get_batch_stock_data(["AAPL", "MSFT"], period="1mo")
-
-        assert len(result) == 2
-        assert "AAPL" in result
-        assert "MSFT" in result
-
-    @patch("stock_friend.gateways.yfinance_gateway.yf.download")
     def test_get_batch_stock_data_empty_list(self, mock_download, gateway):
         """Test batch retrieval with empty ticker list."""
         result = gateway.get_batch_stock_data([], period="1mo")
         assert result == {}
         mock_download.assert_not_called()
 
-    @patch("stock_friend.gateways.yfinance_gateway.yf.download")
-    def test_get_batch_stock_data_partial_failure(self, mock_download, gateway):
-        """Test batch retrieval with some tickers failing."""
-        # Mock download that returns empty DataFrame for one ticker
-        dates = pd.date_range(start="2025-01-01", periods=3, freq="D")
-        aapl_data = pd.DataFrame(
-            {
-                "Date": dates,
-                "Open": [100, 101, 102],
-                "High": [105, 106, 107],
-                "Low": [95, 96, 97],
-                "Close": [102, 103, 104],
-                "Volume": [1000000, 1100000, 1200000],
-            }
+    @pytest.mark.parametrize(
+        "frame_fixture,tickers,expected",
+        [
+            ("multi_ticker_df", ["AAPL", "MSFT"], {"AAPL", "MSFT"}),
+            # Empty frame for an invalid ticker; only the successful one is returned
+            ("partial_multi_df", ["AAPL", "INVALID"], {"AAPL"}),
+        ],
+        ids=["multiple_tickers", "partial_failure"],
+    )
+    def test_get_batch_stock_data_multi_ticker(
+        self, mock_download, gateway, request, frame_fixture, tickers, expected
+    ):
+        """Test batch retrieval splits a multi-ticker frame, skipping empty tickers."""
+        mock_download.side_effect = _download_serving(
+            {tuple(tickers): request.getfixturevalue(frame_fixture)}
         )
-        invalid_data = pd.DataFrame()  # Empty for invalid ticker
 
-        multi_df = pd.concat({"AAPL": aapl_data, "INVALID": invalid_data}, axis=1)
-        mock_download.return_value = multi_df
+        result = gateway.get_batch_stock_data(tickers, period="1mo")
 
-        result = gateway.get_batch_stock_data(["AAPL", "INVALID"], period="1mo")
-
-        # Should return successful ticker only
-        assert "AAPL" in result
-        assert "INVALID" not in result or result.get("INVALID") is None
+        assert set(result) == expected
 
 
 class TestGetCurrentPrice:
     """Test get_current_price method."""
 
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
-    def test_get_current_price_success(self, mock_ticker_class, gateway):
-        """Test successful current price retrieval."""
-        mock_ticker = Mock()
-        mock_ticker.info = {"currentPrice": 150.50}
-        mock_ticker_class.return_value = mock_ticker
-
-        price = gateway.get_current_price("AAPL")
-
-        assert isinstance(price, Decimal)
-        assert price == Decimal("150.50")
-
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
-    def test_get_current_price_fallback_to_regular_market_price(
-        self, mock_ticker_class, gateway
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("currentPrice", PRICE_150_50),
+            ("regularMarketPrice", PRICE_151_75),
+            ("previousClose", PRICE_149_25),
+        ],
+        ids=["current_price", "fallback_regular_market_price", "fallback_previous_close"],
+    )
+    def test_get_current_price_fields(
+        self, mock_ticker_class, ticker_factory, gateway, field, value
     ):
-        """Test fallback to regularMarketPrice field."""
-        mock_ticker = Mock()
-        mock_ticker.info = {"regularMarketPrice": 151.75}
-        mock_ticker_class.return_value = mock_ticker
+        """Test price is read from currentPrice, falling back to other info fields."""
+        mock_ticker_class.return_value = ticker_factory(info={field: float(value)})
 
         price = gateway.get_current_price("AAPL")
-        assert price == Decimal("151.75")
-
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
-    def test_get_current_price_fallback_to_previous_close(self, mock_ticker_class, gateway):
-        """Test fallback to previousClose field."""
-        mock_ticker = Mock()
-        mock_ticker.info = {"previousClose": 149.25}
-        mock_ticker_class.return_value = mock_ticker
 
-        price = gateway.get_current_price("AAPL")
-        assert price == Decimal("149.25")
+        assert isinstance(price, Decimal)
+        assert price == value
 
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
-    def test_get_current_price_no_data(self, mock_ticker_class, gateway):
+    def test_get_current_price_no_data(self, mock_ticker_class, ticker_factory, gateway):
         """Test error when no price data available."""
-        mock_ticker = Mock()
-        mock_ticker.info = {}
-        mock_ticker_class.return_value = mock_ticker
+        mock_ticker_class.return_value = ticker_factory(info={})
 
-        with pytest.raises(DataProviderException, match="No price data available"):
+        with pytest.raises(DataProviderException) as exc_info:
             gateway.get_current_price("INVALID")
-
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
-    def test_get_current_price_caching(self, mock_ticker_class, gateway):
-        """Test that current price is cached."""
-        mock_ticker = Mock()
-        mock_ticker.info = {"currentPrice": 150.50}
-        mock_ticker_class.return_value = mock_ticker
-
-        # First call
-        price1 = gateway.get_current_price("AAPL")
-
-        # Second call - should hit cache
-        price2 = gateway.get_current_price("AAPL")
-
-        assert price1 == price2
-        # Ticker should only be created once
-        assert mock_ticker_class.call_count == 1
+        assert "No price data available" in str(exc_info.value)
 
 
 class TestGetBatchCurrentPrices:
     """Test get_batch_current_prices method."""
 
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
-    def test_get_batch_current_prices_success(self, mock_ticker_class, gateway):
+    def test_get_batch_current_prices_success(self, mock_ticker_class, ticker_factory, gateway):
         """Test batch current price retrieval."""
         # Mock different prices for different tickers
-        def ticker_side_effect(symbol):
-            mock_ticker = Mock()
-            if symbol == "AAPL":
-                mock_ticker.info = {"currentPrice": 150.50}
-            elif symbol == "MSFT":
-                mock_ticker.info = {"currentPrice": 250.75}
-            return mock_ticker
-
-        mock_ticker_class.side_effect = ticker_side_effect
+        mock_ticker_class.side_effect = lambda s: ticker_factory(info=_BATCH_PRICE_INFO.get(s))
 
         prices = gateway.get_batch_current_prices(["AAPL", "MSFT"])
 
         assert len(prices) == 2
-        assert prices["AAPL"] == Decimal("150.50")
-        assert prices["MSFT"] == Decimal("250.75")
+        assert prices["AAPL"] == PRICE_150_50
+        assert prices["MSFT"] == PRICE_250_75
 
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
-    def test_get_batch_current_prices_partial_failure(self, mock_ticker_class, gateway):
+    def test_get_batch_current_prices_partial_failure(
+        self, mock_ticker_class, ticker_factory, gateway
+    ):
         """Test batch price retrieval with some failures."""
-
-        def ticker_side_effect(symbol):
-            mock_ticker = Mock()
-            if symbol == "AAPL":
-                mock_ticker.info = {"currentPrice": 150.50}
-            else:
-                mock_ticker.info = {}  # No price data
-            return mock_ticker
-
-        mock_ticker_class.side_effect = ticker_side_effect
+        # INVALID has no entry, so its Ticker gets empty info (no price data)
+        mock_ticker_class.side_effect = lambda s: ticker_factory(info=_BATCH_PRICE_INFO.get(s))
 
         prices = gateway.get_batch_current_prices(["AAPL", "INVALID"])
 
@@ -366,20 +375,11 @@ class TestGetBatchCurrentPrices:
 class TestGetFundamentalData:
     """Test get_fundamental_data method."""
 
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
-    def test_get_fundamental_data_success(self, mock_ticker_class, gateway):
+    def test_get_fundamental_data_success(
+        self, mock_ticker_class, ticker_factory, gateway, apple_info
+    ):
         """Test successful fundamental data retrieval."""
-        mock_ticker = Mock()
-        mock_ticker.info = {
-            "longName": "Apple Inc.",
-            "sector": "Technology",
-            "industry": "Consumer Electronics",
-            "marketCap": 3000000000000,
-            "trailingPE": 30.5,
-            "priceToBook": 40.2,
-            "trailingEps": 6.11,
-        }
-        mock_ticker_class.return_value = mock_ticker
+        mock_ticker_class.return_value = ticker_factory(info=apple_info)
 
         fundamental = gateway.get_fundamental_data("AAPL")
 
@@ -387,19 +387,15 @@ class TestGetFundamentalData:
         assert fundamental.ticker == "AAPL"
         assert fundamental.company_name == "Apple Inc."
         assert fundamental.sector == "Technology"
-        assert fundamental.market_cap == Decimal("3000000000000")
+        assert fundamental.market_cap == MARKET_CAP_3T
 
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
-    def test_get_fundamental_data_empty_info(self, mock_ticker_class, gateway):
+    def test_get_fundamental_data_empty_info(self, mock_ticker_class, ticker_factory, gateway):
         """Test fundamental data with empty info."""
-        mock_ticker = Mock()
-        mock_ticker.info = {}
-        mock_ticker_class.return_value = mock_ticker
+        mock_ticker_class.return_value = ticker_factory(info={})
 
         fundamental = gateway.get_fundamental_data("INVALID")
         assert fundamental is None
 
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
     def test_get_fundamental_data_exception(self, mock_ticker_class, gateway):
         """Test that exceptions return None instead of raising."""
         mock_ticker = Mock()
@@ -410,22 +406,38 @@ class TestGetFundamentalData:
         fundamental = gateway.get_fundamental_data("AAPL")
         assert fundamental is None
 
-    @patch("stock_friend.gateways.yfinance_gateway.yf.Ticker")
-    def test_get_fundamental_data_caching(self, mock_ticker_class, gateway):
-        """Test that fundamental data is cached."""
-        mock_ticker = Mock()
-        mock_ticker.info = {
-            "longName": "Apple Inc.",
-            "sector": "Technology",
-        }
+
+class TestCaching:
+    """Test that single-ticker lookups are served from cache on repeat calls."""
+
+    @pytest.mark.parametrize(
+        "method,info_fixture,with_history",
+        [
+            ("get_stock_data", None, True),
+            ("get_current_price", "apple_price_info", False),
+            ("get_fundamental_data", "apple_info", False),
+        ],
+        ids=["stock_data", "current_price", "fundamental_data"],
+    )
+    def test_repeat_call_hits_cache(
+        self, request, mock_ticker_class, ticker_factory, gateway, sample_ohlcv_df,
+        method, info_fixture, with_history,
+    ):
+        """Test the second call returns the cached result without another API call."""
+        mock_ticker = ticker_factory(
+            info=request.getfixturevalue(info_fixture) if info_fixture else None,
+            history=sample_ohlcv_df if with_history else None,
+        )
         mock_ticker_class.return_value = mock_ticker
+        fetch = getattr(gateway, method)
 
-        # First call
-        fund1 = gateway.get_fundamental_data("AAPL")
+        # First call - should hit API
+        result1 = fetch("AAPL")
 
         # Second call - should hit cache
-        fund2 = gateway.get_fundamental_data("AAPL")
+        result2 = fetch("AAPL")
 
-        assert fund1.company_name == fund2.company_name
+        assert result2 is result1
         # Ticker should only be created once
         assert mock_ticker_class.call_count == 1
+        assert mock_ticker.history.call_count == int(with_history)